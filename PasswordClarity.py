@@ -1,11 +1,24 @@
+import time
+STARTUP_BEGIN = time.perf_counter()  # Reference point for --profile-startup
+
 import os
-import platform
-import re
 import sys
 import tkinter as tk
 from tkinter import font as tkfont
 from tkinter import ttk
 
+from PasswordClarity_core import COLORS, count_char_classes
+from PasswordClarity_display import StartupProfile, VirtualizedDisplay, after_first_paint
+
+STARTUP = StartupProfile(STARTUP_BEGIN)
+STARTUP.mark("imports")
+
+# Clipboard watch polls quickly after a change and backs off while it is idle
+CLIPBOARD_POLL_MIN_MS = 250
+CLIPBOARD_POLL_MAX_MS = 4000
+# Larger clipboard text (a copied document) is not a password; analyzing it would freeze the window
+CLIPBOARD_MAX_CHARS = 100_000
+
 # Handle PyInstaller's temp folder vs running from source
 if getattr(sys, '_MEIPASS', None):
     BASE_PATH = sys._MEIPASS
@@ -14,7 +27,7 @@ else:
 
 
 class PasswordVisualizer:
-    def __init__(self, master):
+    def __init__(self, master, watch_clipboard=False):
         self.master = master
         master.title("Password Clarity")
         master.geometry("800x420")
@@ -26,11 +39,11 @@ class PasswordVisualizer:
             master.iconbitmap(icon_path)
 
         # --- Cross-platform font selection ---
-        os_name = platform.system()
-        if os_name == "Windows":
+        # sys.platform rather than platform.system(): importing platform costs startup time
+        if sys.platform == "win32":
             sans_family = "Segoe UI"
             mono_family = "Consolas"
-        elif os_name == "Darwin":
+        elif sys.platform == "darwin":
             sans_family = "Helvetica Neue"
             mono_family = "Menlo"
         else:
@@ -42,13 +55,9 @@ class PasswordVisualizer:
         self.display_font = tkfont.Font(family=mono_family, size=32)
         self.stats_font = tkfont.Font(family=sans_family, size=12)
         self.count_font = tkfont.Font(family=sans_family, size=12, weight="bold")
+        STARTUP.mark("fonts")
 
-        self.colors = {
-            'capital': "#00AA00",
-            'lower': "#0000AA",
-            'number': "#AA0000",
-            'symbol': "#000000"
-        }
+        self.colors = dict(COLORS)
 
         # --- ttk style setup ---
         self.style = ttk.Style()
@@ -71,6 +80,7 @@ class PasswordVisualizer:
         self.style.configure("OK.TButton",
                              font=(sans_family, 14),
                              padding=(20, 8))
+        STARTUP.mark("styles")
 
         # Main frame
         self.main_frame = tk.Frame(master, padx=20, pady=20)
@@ -96,6 +106,17 @@ class PasswordVisualizer:
             command=self.copy_password, style="Gray.TButton")
         self.copy_pw_button.pack(side=tk.LEFT)
 
+        # Opt-in: analyze whatever is copied, without pasting it in
+        self.watch_var = tk.BooleanVar(value=watch_clipboard)
+        self.watch_check = ttk.Checkbutton(
+            self.input_row, text="Watch clipboard", variable=self.watch_var,
+            command=self.toggle_clipboard_watch)
+        self.watch_check.pack(side=tk.LEFT, padx=(8, 0))
+        self.watch_job = None
+        self.watch_interval = CLIPBOARD_POLL_MIN_MS
+        self.clipboard_seen = None  # Digest of the clipboard as last polled
+        self.own_copy = None  # Digest of the last copy_password write
+
         # Color-coded display
         self.display_frame = tk.Frame(self.main_frame, height=90)
         self.display_frame.pack(fill=tk.X, pady=10)
@@ -117,6 +138,8 @@ class PasswordVisualizer:
         self.password_text.tag_configure("lowercase", foreground=self.colors['lower'])
         self.password_text.tag_configure("digit", foreground=self.colors['number'])
         self.password_text.tag_configure("symbol", foreground=self.colors['symbol'])
+        self.password_text.tag_configure("confusable", background=self.colors['confusable'])
+        self.display = VirtualizedDisplay(self.password_text, self.h_scrollbar)
 
         # Strength bar + label + counts
         self.strength_frame = tk.Frame(self.main_frame)
@@ -168,24 +191,62 @@ class PasswordVisualizer:
         self.input_box.focus_set()
 
         self.result = None
+        STARTUP.mark("widgets")
+        after_first_paint(master, self.on_first_paint)
+        if watch_clipboard:
+            master.after_idle(self.toggle_clipboard_watch)
+
+    def on_first_paint(self):
+        STARTUP.mark("first paint")
+        STARTUP.report()
 
     def copy_password(self):
         pw = self.input_var.get()
         if pw:
             self.master.clipboard_clear()
             self.master.clipboard_append(pw)
+            self.own_copy = self.clipboard_digest(pw)  # Don't let the watcher pick it up again
             original = self.copy_pw_button.cget("text")
             self.copy_pw_button.config(text="Copied!")
             self.master.after(1500, lambda: self.copy_pw_button.config(text=original))
 
+    def clipboard_digest(self, text):
+        # Compare clipboard contents by hash so no extra copy of a secret is kept
+        import hashlib
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def toggle_clipboard_watch(self):
+        if self.watch_job is not None:
+            self.master.after_cancel(self.watch_job)
+            self.watch_job = None
+        if self.watch_var.get():
+            self.clipboard_seen = None  # Pick up what is on the clipboard right now
+            self.poll_clipboard()
+
+    def poll_clipboard(self):
+        try:
+            text = self.master.clipboard_get()
+        except tk.TclError:
+            text = ""  # Empty clipboard, or content that is not text
+
+        digest = self.clipboard_digest(text)
+        if digest != self.clipboard_seen:
+            self.clipboard_seen = digest
+            self.watch_interval = CLIPBOARD_POLL_MIN_MS
+            text = text.strip("\r\n")
+            if (text and len(text) <= CLIPBOARD_MAX_CHARS and digest != self.own_copy
+                    and text != self.input_var.get()):
+                self.input_var.set(text)
+        else:
+            # Unchanged: nothing to analyze, and poll less often until something is copied
+            self.watch_interval = min(self.watch_interval * 2, CLIPBOARD_POLL_MAX_MS)
+        self.watch_job = self.master.after(self.watch_interval, self.poll_clipboard)
+
     def get_password_strength(self, password):
         if not password:
             return {'score': 0, 'capitals': 0, 'lowers': 0, 'numbers': 0, 'symbols': 0}
 
-        capitals = len(re.findall(r'[A-Z]', password))
-        lowers = len(re.findall(r'[a-z]', password))
-        numbers = len(re.findall(r'\d', password))
-        symbols = len(re.findall(r'[^A-Za-z0-9]', password))
+        capitals, lowers, numbers, symbols = count_char_classes(password)
         length = len(password)
 
         score = min(length * 4, 40)
@@ -226,25 +287,7 @@ class PasswordVisualizer:
             self.strength_label.config(fg="#00AA00")
             self.style.configure("Horizontal.TProgressbar", troughcolor="#f0f0f0", background="#00AA00")
 
-        if not password:
-            self.password_text.config(state=tk.NORMAL)
-            self.password_text.delete(1.0, tk.END)
-            self.password_text.config(state=tk.DISABLED)
-            return
-
-        self.password_text.config(state=tk.NORMAL)
-        self.password_text.delete(1.0, tk.END)
-
-        for char in password:
-            if re.match(r'[A-Z]', char): tag = "uppercase"
-            elif re.match(r'[a-z]', char): tag = "lowercase"
-            elif re.match(r'\d', char): tag = "digit"
-            else: tag = "symbol"
-            self.password_text.insert(tk.END, char, tag)
-
-        self.password_text.tag_add("center", "1.0", "end")
-        self.password_text.tag_configure("center", justify='center')
-        self.password_text.config(state=tk.DISABLED)
+        self.display.show(password)
 
     def on_ok(self):
         self.result = self.input_var.get()
@@ -254,15 +297,16 @@ class PasswordVisualizer:
         return self.result
 
 
-def show_password_window():
+def show_password_window(watch_clipboard=False):
     root = tk.Tk()
-    app = PasswordVisualizer(root)
+    STARTUP.mark("tk")
+    app = PasswordVisualizer(root, watch_clipboard)
     root.mainloop()
     return app.get_result()
 
 
 if __name__ == "__main__":
-    password = show_password_window()
+    password = show_password_window("--watch-clipboard" in sys.argv)
     if password:
         print(f"Password entered: {password}")
     else:
@@ -0,0 +1,591 @@
+import argparse
+import hashlib
+import heapq
+import html
+import itertools
+import json
+import mmap
+import os
+import sys
+import tempfile
+import unicodedata
+
+from PasswordClarity_breach import open_breach_mirror
+from PasswordClarity_core import (AMBIGUOUS_ASCII, COLORS, TAG_COLORS, AsciiBytesAnalyzer,
+                                  PasswordAnalyzer, classify_char, password_skeleton)
+from PasswordClarity_markov import open_strength_model
+
+
+def read_credentials(stream, separator):
+    """Yield (account, password) pairs from an audit export
+
+    Each line is "account<separator>password"; lines without the separator
+    are treated as a bare password and labelled with their line number.
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+        account, sep, password = line.partition(separator)
+        if not sep:
+            account, password = f"line{line_number}", line
+        if password:
+            yield account, password
+
+
+# Shorter skeletons ("a" from "a1", "x" from "x99!") are too common to suggest reuse
+MIN_SKELETON_LENGTH = 4
+
+
+def digest(text):
+    """Short stable hash so plaintext never has to be kept for grouping"""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class DuplicateFinder:
+    """Group exact and near-duplicate passwords in a single streaming pass
+
+    Records are keyed by the hash of the password skeleton (see
+    password_skeleton) and carry the hash of the exact password, its score
+    and the account name, so both kinds of reuse fall out of the same
+    grouping and no plaintext password is kept.  Groups are held in memory
+    until max_records is reached; after that each batch is written out as a
+    sorted run and the runs are merged at the end (external sort), so the
+    audit set can be far larger than RAM.
+    """
+
+    def __init__(self, analyzer=None, max_records=1_000_000, temp_dir=None):
+        self.analyzer = analyzer or PasswordAnalyzer()
+        self.max_records = max_records
+        self.temp_dir = temp_dir
+        self.groups = {}
+        self.buffered = 0
+        self.runs = []
+
+    def add(self, account, password):
+        """Add one credential to the audit set"""
+        exact = digest(password)
+        skeleton = password_skeleton(password)
+        # Passwords without a distinctive skeleton only count as exact reuse
+        key = digest("~" + skeleton) if len(skeleton) >= MIN_SKELETON_LENGTH else "=" + exact
+        score = self.analyzer.get_password_strength(password)['score']
+
+        self.groups.setdefault(key, []).append((exact, score, account))
+        self.buffered += 1
+        if self.buffered >= self.max_records:
+            self.spill()
+
+    def spill(self):
+        """Write the in-memory groups to a sorted run file and clear them"""
+        if not self.groups:
+            return
+        # Account names read with surrogateescape must survive the round trip
+        run = tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="surrogateescape",
+                                     dir=self.temp_dir)
+        for key in sorted(self.groups):
+            for exact, score, account in sorted(self.groups[key]):
+                run.write(f"{key}\t{exact}\t{score}\t{account}\n")
+        run.seek(0)
+        self.runs.append(run)
+        self.groups = {}
+        self.buffered = 0
+
+    def _records(self):
+        """Yield (key, exact, score, account) sorted by key"""
+        if not self.runs:
+            for key in sorted(self.groups):
+                for exact, score, account in sorted(self.groups[key]):
+                    yield key, exact, score, account
+            return
+
+        self.spill()
+
+        def parse(run):
+            for line in run:
+                key, exact, score, account = line.rstrip("\n").split("\t", 3)
+                yield key, exact, int(score), account
+
+        yield from heapq.merge(*(parse(run) for run in self.runs))
+
+    def groups_found(self, min_size=2):
+        """Yield one summary dict per group of reused passwords"""
+        try:
+            for key, records in itertools.groupby(self._records(), key=lambda r: r[0]):
+                records = list(records)
+                if len(records) < min_size:
+                    continue
+                # Records are sorted by exact hash within a group, so exact reuse is contiguous
+                exact_groups = [accounts for accounts in
+                                ([r[3] for r in same] for _, same in
+                                 itertools.groupby(records, key=lambda r: r[1]))
+                                if len(accounts) > 1]
+                distinct = len({r[1] for r in records})
+                yield {
+                    'group': key.lstrip("=")[:12],
+                    'kind': "exact" if distinct == 1 else "near",
+                    'accounts': [r[3] for r in records],
+                    'distinct_passwords': distinct,
+                    'min_score': min(r[2] for r in records),
+                    'exact_reuse': exact_groups,
+                }
+        finally:
+            for run in self.runs:
+                run.close()
+            self.runs = []
+
+
+def run_duplicates(args):
+    """Report password reuse clusters for an audit export"""
+    finder = DuplicateFinder(max_records=args.max_records, temp_dir=args.temp_dir)
+    with open(args.input, encoding="utf-8", errors="surrogateescape") as stream:
+        for account, password in read_credentials(stream, args.separator):
+            finder.add(account, password)
+
+    out = sys.stdout
+    if hasattr(out, "reconfigure"):
+        out.reconfigure(errors="surrogateescape")  # Write undecodable account names back as bytes
+    out.write("group\tkind\taccounts\tdistinct\tmin_score\tmembers\texact_reuse\n")
+    for group in finder.groups_found(args.min_size):
+        out.write(f"{group['group']}\t{group['kind']}\t{len(group['accounts'])}\t"
+                  f"{group['distinct_passwords']}\t{group['min_score']}\t"
+                  f"{','.join(group['accounts'])}\t"
+                  f"{';'.join(','.join(accounts) for accounts in group['exact_reuse'])}\n")
+    return 0
+
+
+def iter_buffer_lines(path):
+    """Yield the raw lines of a file through a read-only memory map"""
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty files cannot be mapped
+        with buffer:
+            for line in iter(buffer.readline, b""):
+                yield line.rstrip(b"\r\n")
+
+
+def scan_analyzer(args):
+    """Build the bytes analyzer for scan and export from their options"""
+    mirror = None
+    if args.breach_mirror:
+        mirror = open_breach_mirror(args.breach_mirror)
+        if mirror is None:
+            sys.exit(f"{args.breach_mirror} is not a breach mirror")
+    model = None
+    if args.model:
+        model = open_strength_model(args.model)
+        if model is None:
+            sys.exit(f"{args.model} does not exist")
+    return AsciiBytesAnalyzer(PasswordAnalyzer(breach_mirror=mirror, strength_model=model))
+
+
+def iter_scan_results(path, analyzer, separator):
+    """Yield (account, password bytes, strength, warnings) for each line of a raw export"""
+    separator = separator.encode("utf-8") if separator else None
+    for line_number, line in enumerate(iter_buffer_lines(path), 1):
+        if not line:
+            continue
+        account = f"line{line_number}"
+        if separator:
+            name, sep, password = line.partition(separator)
+            if sep:
+                account, line = name.decode("utf-8", "replace"), password
+        strength, warnings = analyzer.analyze_line(line)
+        yield account, line, strength, warnings
+
+
+def run_scan(args):
+    """Score every password in a raw export without decoding ASCII lines"""
+    analyzer = scan_analyzer(args)
+    out = sys.stdout
+    out.write("account\tscore\tcapitals\tlowers\tnumbers\tsymbols\twarnings\n")
+    for account, _, strength, warnings in iter_scan_results(args.input, analyzer, args.separator):
+        out.write(f"{account}\t{strength['score']}\t{strength['capitals']}\t"
+                  f"{strength['lowers']}\t{strength['numbers']}\t{strength['symbols']}\t"
+                  f"{'; '.join(warnings)}\n")
+    return 0
+
+
+# Bit of each warning kind in the export's warning_flags column, matched like score_counts
+WARNING_FLAGS = [
+    ("common", "commonly used password"),
+    ("breach", "breach corpus"),
+    ("guessable", "guessing models"),
+    ("keyboard", "keyboard pattern"),
+    ("sequential", "sequential numbers"),
+    ("repeated", "repeated characters"),
+    ("dictionary", "dictionary word"),
+    ("predictable", "predictable pattern"),
+    ("short", "too short"),
+    ("no_uppercase", "uppercase letters"),
+    ("no_lowercase", "lowercase letters"),
+    ("no_numbers", "adding numbers"),
+    ("no_symbols", "adding symbols"),
+]
+
+
+def warning_flags(warnings):
+    """Pack warning messages into a bitmask of WARNING_FLAGS"""
+    flags = 0
+    for warning in warnings:
+        for bit, (_, text) in enumerate(WARNING_FLAGS):
+            if text in warning:
+                flags |= 1 << bit
+                break
+    return flags
+
+
+MIN_SALT_BYTES = 16  # An empty or short key would make the hashes guessable offline
+
+
+def export_schema(pa, with_guesses):
+    """Arrow schema of the export, with the flag legend and hash scheme as metadata"""
+    fields = [
+        pa.field("account", pa.string()),
+        pa.field("password_hash", pa.binary(32)),
+        pa.field("length", pa.uint32()),
+        pa.field("score", pa.uint8()),
+        pa.field("capitals", pa.uint32()),
+        pa.field("lowers", pa.uint32()),
+        pa.field("numbers", pa.uint32()),
+        pa.field("symbols", pa.uint32()),
+        pa.field("warning_flags", pa.uint16()),
+    ]
+    if with_guesses:
+        fields.append(pa.field("guesses", pa.float64()))
+    metadata = {
+        "password_clarity.warning_flags": json.dumps({name: 1 << bit for bit, (name, _) in
+                                                      enumerate(WARNING_FLAGS)}),
+        "password_clarity.password_hash": "blake2b-256 of the password bytes, keyed with the export salt",
+    }
+    return pa.schema(fields, metadata=metadata)
+
+
+def run_export(args):
+    """Write scan results as Parquet or an Arrow IPC stream, one bounded batch at a time"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet
+    except ImportError:
+        sys.exit("export needs pyarrow (pip install pyarrow)")
+
+    # The salt never goes into the file; reuse a salt file to join hashes across exports
+    if args.salt_file:
+        with open(args.salt_file, "rb") as f:
+            salt = f.read()[:64]
+        if len(salt) < MIN_SALT_BYTES:
+            sys.exit(f"{args.salt_file} holds {len(salt)} bytes; the export salt needs at least "
+                     f"{MIN_SALT_BYTES} (e.g. head -c 32 /dev/urandom > {args.salt_file})")
+    else:
+        salt = os.urandom(32)
+
+    analyzer = scan_analyzer(args)
+    with_guesses = analyzer.analyzer.strength_model is not None
+    schema = export_schema(pa, with_guesses)
+    if args.format == "parquet":
+        writer = pa.parquet.ParquetWriter(args.output, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(args.output, schema)
+
+    columns = {name: [] for name in schema.names}
+
+    def flush():
+        if columns["account"]:
+            arrays = [pa.array(columns[field.name], type=field.type) for field in schema]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            for column in columns.values():
+                column.clear()
+
+    with writer:
+        for account, password, strength, warnings in iter_scan_results(
+                args.input, analyzer, args.separator):
+            columns["account"].append(account)
+            columns["password_hash"].append(
+                hashlib.blake2b(password, digest_size=32, key=salt).digest())
+            # Characters, as scored and as the class counts add up to, not bytes
+            columns["length"].append(len(password) if password.isascii() else
+                                     len(password.decode("utf-8", "surrogateescape")))
+            columns["score"].append(strength['score'])
+            columns["capitals"].append(strength['capitals'])
+            columns["lowers"].append(strength['lowers'])
+            columns["numbers"].append(strength['numbers'])
+            columns["symbols"].append(strength['symbols'])
+            columns["warning_flags"].append(warning_flags(warnings))
+            if with_guesses:
+                columns["guesses"].append(strength.get('guesses'))
+            if len(columns["account"]) >= args.row_group_size:
+                flush()
+        flush()
+    return 0
+
+
+NATO_ALPHABET = {
+    'a': "alfa", 'b': "bravo", 'c': "charlie", 'd': "delta", 'e': "echo", 'f': "foxtrot",
+    'g': "golf", 'h': "hotel", 'i': "india", 'j': "juliett", 'k': "kilo", 'l': "lima",
+    'm': "mike", 'n': "november", 'o': "oscar", 'p': "papa", 'q': "quebec", 'r': "romeo",
+    's': "sierra", 't': "tango", 'u': "uniform", 'v': "victor", 'w': "whiskey", 'x': "x-ray",
+    'y': "yankee", 'z': "zulu"
+}
+DIGIT_NAMES = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+SYMBOL_NAMES = {
+    ' ': "space", '!': "exclamation", '"': "double quote", '#': "hash", '$': "dollar",
+    '%': "percent", '&': "ampersand", "'": "apostrophe", '(': "open paren", ')': "close paren",
+    '*': "asterisk", '+': "plus", ',': "comma", '-': "dash", '.': "dot", '/': "slash",
+    ':': "colon", ';': "semicolon", '<': "less than", '=': "equals", '>': "greater than",
+    '?': "question mark", '@': "at", '[': "open bracket", '\\': "backslash",
+    ']': "close bracket", '^': "caret", '_': "underscore", '`': "backtick",
+    '{': "open brace", '|': "pipe", '}': "close brace", '~': "tilde"
+}
+
+
+def undecodable_byte(char):
+    """Return the raw byte a surrogateescape character stands for, or None"""
+    code = ord(char)
+    return code - 0xDC00 if 0xDC80 <= code <= 0xDCFF else None
+
+
+def display_char(char):
+    """The character to draw in HTML and SVG, which cannot carry raw bytes"""
+    return "\ufffd" if undecodable_byte(char) is not None else char
+
+
+def spell_char(char):
+    """Spell one character the way it should be read aloud"""
+    if char.isascii():
+        lower = char.lower()
+        if lower in NATO_ALPHABET:
+            word = NATO_ALPHABET[lower]
+            return f"CAPITAL {word.upper()}" if char.isupper() else f"lower {word}"
+        if char.isdigit():
+            return f"digit {DIGIT_NAMES[int(char)]}"
+        return SYMBOL_NAMES.get(char, f"U+{ord(char):04X}")
+
+    byte = undecodable_byte(char)
+    if byte is not None:
+        return f"byte 0x{byte:02X}"
+    name = unicodedata.name(char, f"U+{ord(char):04X}").lower()
+    lookalike = classify_char(char)[1]
+    if lookalike == "":
+        return f"{name} (invisible)"
+    if lookalike is not None:
+        return f"{name} (looks like {spell_char(lookalike)})"
+    return name
+
+
+def describe_token(token):
+    """Return the confusable-character report for one token"""
+    ambiguous = []
+    for position, char in enumerate(token, 1):
+        lookalike = classify_char(char)[1]
+        if undecodable_byte(char) is not None:
+            ambiguous.append((position, char, "not valid UTF-8"))
+        elif lookalike is not None:
+            ambiguous.append((position, char, "invisible" if lookalike == ""
+                              else f"lookalike of {lookalike!r}"))
+        elif char in AMBIGUOUS_ASCII:
+            ambiguous.append((position, char, f"one of {AMBIGUOUS_ASCII[char]}"))
+    return {
+        'token': token,
+        'ambiguous': ambiguous,
+        'spelled': [spell_char(char) for char in token],
+    }
+
+
+def char_style(char):
+    """Return (foreground, background or None, ambiguous) for rendering one character"""
+    tag, lookalike = classify_char(char)
+    background = COLORS['confusable'] if lookalike is not None else None
+    return COLORS[TAG_COLORS[tag]], background, char in AMBIGUOUS_ASCII
+
+
+def ansi_color(hex_color, background=False):
+    """Return the 24-bit ANSI escape for a #RRGGBB colour"""
+    red, green, blue = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"\x1b[{48 if background else 38};2;{red};{green};{blue}m"
+
+
+def render_ansi(token):
+    """Colour a token for a 24-bit colour terminal
+
+    Symbols use the terminal's default colour rather than black so they stay
+    visible on dark backgrounds; ambiguous ASCII characters are underlined.
+    """
+    out = []
+    for char in token:
+        foreground, background, ambiguous = char_style(char)
+        codes = "" if foreground == COLORS['symbol'] else ansi_color(foreground)
+        if background:
+            codes += ansi_color(background, background=True)
+        if ambiguous:
+            codes += "\x1b[4m"
+        out.append(f"{codes}{char}\x1b[0m" if codes else char)
+    return "".join(out)
+
+
+def write_text_report(reports, out, colour=False):
+    """Write the plain (or ANSI-coloured) report, one block per token"""
+    for number, report in enumerate(reports, 1):
+        token = report['token']
+        out.write(f"#{number}  length {len(token)}  ambiguous {len(report['ambiguous'])}\n")
+        out.write(f"  {render_ansi(token) if colour else token}\n")
+        if report['ambiguous']:
+            out.write("  ambiguous: " + ", ".join(
+                f"{position}:{char!r} ({reason})" for position, char, reason in report['ambiguous'])
+                + "\n")
+        out.write("  spelled: " + ", ".join(report['spelled']) + "\n\n")
+
+
+def html_token(token):
+    """Colour a token with inline-styled HTML spans"""
+    spans = []
+    for char in token:
+        foreground, background, ambiguous = char_style(char)
+        style = f"color:{foreground}"
+        if background:
+            style += f";background:{background}"
+        if ambiguous:
+            style += ";text-decoration:underline"
+        spans.append(f'<span style="{style}">{html.escape(display_char(char))}</span>')
+    return "".join(spans)
+
+
+def write_html_report(reports, out):
+    """Write the report as a standalone HTML table"""
+    out.write('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Password Clarity report</title>\n'
+              '<style>body{font-family:sans-serif}td{padding:4px 8px;vertical-align:top}'
+              '.token{font-family:monospace;font-size:20px;white-space:pre}</style></head><body>\n'
+              '<table>\n<tr><th>#</th><th>Token</th><th>Ambiguous</th><th>Spelled</th></tr>\n')
+    for number, report in enumerate(reports, 1):
+        ambiguous = "<br>".join(html.escape(f"{position}: {char!r} ({reason})")
+                                for position, char, reason in report['ambiguous'])
+        spelled = html.escape(", ".join(report['spelled']))
+        out.write(f'<tr><td>{number}</td><td class="token">{html_token(report["token"])}</td>'
+                  f'<td>{ambiguous}</td><td>{spelled}</td></tr>\n')
+    out.write("</table>\n</body></html>\n")
+
+
+def write_svg_report(reports, out, font_size=20):
+    """Render every token on its own row of a monospace SVG"""
+    char_width = font_size * 0.6
+    row_height = font_size * 1.6
+    longest = max((len(report['token']) for report in reports), default=0)
+    width = int(char_width * (longest + 6)) + 20
+    height = int(row_height * len(reports)) + 20
+    out.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+              f'font-family="monospace" font-size="{font_size}">\n'
+              f'<rect width="100%" height="100%" fill="white"/>\n')
+    for row, report in enumerate(reports):
+        baseline = 10 + row_height * row + font_size
+        out.write(f'<text x="10" y="{baseline:.1f}" fill="#666666">{row + 1}</text>\n')
+        for column, char in enumerate(report['token']):
+            foreground, background, ambiguous = char_style(char)
+            x = 10 + char_width * (column + 5)
+            if background:
+                out.write(f'<rect x="{x:.1f}" y="{baseline - font_size:.1f}" '
+                          f'width="{char_width:.1f}" height="{row_height:.1f}" fill="{background}"/>\n')
+            decoration = ' text-decoration="underline"' if ambiguous else ""
+            out.write(f'<text x="{x:.1f}" y="{baseline:.1f}" fill="{foreground}"{decoration} '
+                      f'xml:space="preserve">{html.escape(display_char(char))}</text>\n')
+    out.write("</svg>\n")
+
+
+def run_report(args):
+    """Write a confusable-character report for a list of tokens"""
+    reports = []
+    for path in args.input:
+        # Undecodable bytes are kept and reported rather than aborting the report
+        if path == "-":
+            stream = sys.stdin
+            if hasattr(stream, "reconfigure"):
+                stream.reconfigure(errors="surrogateescape")
+        else:
+            stream = open(path, encoding="utf-8", errors="surrogateescape")
+        with stream:
+            for line in stream:
+                token = line.rstrip("\r\n")
+                if token:
+                    reports.append(describe_token(token))
+
+    if args.output == "-":
+        out = sys.stdout
+        if hasattr(out, "reconfigure"):
+            out.reconfigure(errors="surrogateescape")  # Text reports write the raw bytes back
+    else:
+        out = open(args.output, "w", encoding="utf-8", errors="surrogateescape")
+    try:
+        if args.format == "html":
+            write_html_report(reports, out)
+        elif args.format == "svg":
+            write_svg_report(reports, out)
+        else:
+            write_text_report(reports, out, colour=args.format == "ansi")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="PasswordClarity_audit",
+        description="Headless Password Clarity tools for auditing password sets")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    duplicates = commands.add_parser(
+        "duplicates", help="find exact and near-duplicate passwords across accounts")
+    duplicates.add_argument("input", help="file with one account<TAB>password per line")
+    duplicates.add_argument("--separator", default="\t",
+                            help="account/password separator (default: tab)")
+    duplicates.add_argument("--min-size", type=int, default=2,
+                            help="smallest group to report (default: 2)")
+    duplicates.add_argument("--max-records", type=int, default=1_000_000,
+                            help="records held in memory before spilling to disk")
+    duplicates.add_argument("--temp-dir", default=None,
+                            help="directory for external-sort run files")
+    duplicates.set_defaults(func=run_duplicates)
+
+    scan = commands.add_parser(
+        "scan", help="score every password in a raw export (fast bytes path for ASCII)")
+    scan.add_argument("input", help="file with one password (or account<SEP>password) per line")
+    scan.add_argument("--separator", default=None,
+                      help="account/password separator (default: whole line is the password)")
+    scan.add_argument("--breach-mirror", default=None,
+                      help="local breach-corpus mirror (default: $PASSWORD_CLARITY_BREACH_MIRROR)")
+    scan.add_argument("--model", default=None,
+                      help="guess-number model from PasswordClarity_markov.py (default: $PASSWORD_CLARITY_MODEL)")
+    scan.set_defaults(func=run_scan)
+
+    export = commands.add_parser(
+        "export", help="write scan results as Parquet or Arrow, with hashes instead of plaintext")
+    export.add_argument("input", help="file with one password (or account<SEP>password) per line")
+    export.add_argument("output", help="output file")
+    export.add_argument("--format", choices=["parquet", "arrow"], default="parquet",
+                        help="parquet file or Arrow IPC stream (default: parquet)")
+    export.add_argument("--separator", default=None,
+                        help="account/password separator (default: whole line is the password)")
+    export.add_argument("--salt-file", default=None,
+                        help="key for the password hashes, 16-64 bytes (default: a random key per export)")
+    export.add_argument("--row-group-size", type=int, default=65536,
+                        help="rows per record batch / row group (default: 65536)")
+    export.add_argument("--breach-mirror", default=None,
+                        help="local breach-corpus mirror (default: $PASSWORD_CLARITY_BREACH_MIRROR)")
+    export.add_argument("--model", default=None,
+                        help="guess-number model from PasswordClarity_markov.py (default: $PASSWORD_CLARITY_MODEL)")
+    export.set_defaults(func=run_export)
+
+    report = commands.add_parser(
+        "report", help="show ambiguous characters and a phonetic spelling for tokens")
+    report.add_argument("input", nargs="*", default=["-"],
+                        help="files with one token per line (default: stdin)")
+    report.add_argument("--format", choices=["text", "ansi", "html", "svg"], default="text",
+                        help="output format (default: text)")
+    report.add_argument("--output", default="-", help="output file (default: stdout)")
+    report.set_defaults(func=run_report)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
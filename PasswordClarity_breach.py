@@ -0,0 +1,326 @@
+import argparse
+import collections
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+
+MANIFEST = "manifest.json"
+SPILL_PREFIX = "spill-"
+MARKER = ".merged"  # Id of the last import run merged into a bucket directory
+PREFIX_LENGTH = 5  # Same 5-hex-character prefix as the k-anonymity range model
+HASH_LINE = re.compile(r'^([0-9A-Fa-f]{40})(?::(\d+))?$')
+
+
+def sha1_hex(password):
+    """Upper-case SHA-1 hex digest of a password, as used by breach corpora"""
+    if isinstance(password, str):
+        password = encode_password(password)
+    return hashlib.sha1(password).hexdigest().upper()
+
+
+def encode_password(password):
+    """UTF-8 bytes of a str password, restoring bytes that were decoded with surrogateescape"""
+    try:
+        return password.encode("utf-8", "surrogateescape")
+    except UnicodeEncodeError:
+        return password.encode("utf-8", "surrogatepass")  # Lone surrogates from elsewhere
+
+
+def shard_path(root, prefix):
+    """Path of the shard holding every hash that starts with prefix"""
+    return os.path.join(root, prefix[:2], prefix + ".txt")
+
+
+def read_shard(path):
+    """Return {suffix: count} for one shard file ({} if it does not exist)"""
+    try:
+        with open(path, encoding="ascii") as f:
+            return {suffix: int(count) for suffix, _, count in
+                    (line.rstrip("\n").partition(":") for line in f)}
+    except FileNotFoundError:
+        return {}
+
+
+class BreachMirror:
+    """Read side of a local breach-corpus mirror in the SHA-1 range layout
+
+    The mirror holds one shard per 5-character SHA-1 prefix, each a sorted
+    list of "SUFFIX:COUNT" lines, the same split as the k-anonymity range
+    API.  A lookup hashes the password, reads only the one shard for its
+    prefix and keeps the most recently used shards parsed in memory, so
+    checks work offline and stay fast on air-gapped hosts.
+    """
+
+    def __init__(self, root, cache_shards=256):
+        self.root = root
+        self.cache_shards = cache_shards
+        self.shards = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def shard(self, prefix):
+        """Return the parsed shard for prefix, from the LRU when it is hot"""
+        with self.lock:
+            shard = self.shards.get(prefix)
+            if shard is not None:
+                self.shards.move_to_end(prefix)
+                return shard
+
+        shard = read_shard(shard_path(self.root, prefix))
+        with self.lock:
+            self.shards[prefix] = shard
+            while len(self.shards) > self.cache_shards:
+                self.shards.popitem(last=False)
+        return shard
+
+    def count(self, password):
+        """How many times password (str or bytes) appears in the corpus"""
+        digest = sha1_hex(password)
+        return self.shard(digest[:PREFIX_LENGTH]).get(digest[PREFIX_LENGTH:], 0)
+
+
+def open_breach_mirror(root=None):
+    """Open the mirror at root or $PASSWORD_CLARITY_BREACH_MIRROR, or return None"""
+    root = root or os.environ.get("PASSWORD_CLARITY_BREACH_MIRROR")
+    if root and os.path.isfile(os.path.join(root, MANIFEST)):
+        return BreachMirror(root)
+    return None
+
+
+def iter_dump_hashes(path, dump_format="auto"):
+    """Yield (sha1_hex, count) for each entry of a downloaded dump file
+
+    Dumps are either hash lists ("SHA1" or "SHA1:COUNT" per line, as
+    published by breach-corpus services) or plaintext passwords, one per
+    line, which are hashed here.  "auto" treats any line that looks like a
+    SHA-1 hash as one.
+    """
+    with open(path, "rb") as f:
+        for raw in f:
+            raw = raw.rstrip(b"\r\n")
+            if not raw:
+                continue
+            if dump_format != "plain":
+                match = HASH_LINE.match(raw.decode("latin-1"))
+                if match:
+                    yield match.group(1).upper(), int(match.group(2) or 1)
+                    continue
+                if dump_format == "sha1":
+                    continue  # Not a hash line; skip headers and junk
+            yield sha1_hex(raw), 1
+
+
+def load_manifest(root):
+    """Return the mirror manifest, or an empty one for a new mirror"""
+    try:
+        with open(os.path.join(root, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'format': 1, 'sources': {}}
+
+
+def save_manifest(root, manifest):
+    """Write the manifest atomically so an interrupted refresh leaves the old one"""
+    path = os.path.join(root, MANIFEST)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def merge_bucket(root, bucket, spill, run_id):
+    """Add the counts in one spill into its bucket directory, all or nothing
+
+    The bucket (every shard sharing the first two hex digits) is rebuilt in
+    a staging directory: touched shards are rewritten, the rest hard-linked,
+    and a marker records the run.  The staging copy is then swapped in, so an
+    interrupted build never leaves a bucket half merged, and a resumed run
+    skips buckets whose marker shows they already hold its counts.
+    """
+    live = os.path.join(root, bucket)
+    if read_marker(live) == run_id:
+        return
+
+    counts = collections.defaultdict(lambda: collections.defaultdict(int))
+    for line in spill:
+        digest, _, count = line.rstrip("\n").partition(":")
+        counts[digest[:PREFIX_LENGTH]][digest[PREFIX_LENGTH:]] += int(count)
+
+    staging = live + ".new"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    untouched = set(os.listdir(live)) if os.path.isdir(live) else set()
+    untouched.discard(MARKER)
+    for prefix, added in counts.items():
+        name = prefix + ".txt"
+        untouched.discard(name)
+        shard = read_shard(os.path.join(live, name))
+        for suffix, count in added.items():
+            shard[suffix] = shard.get(suffix, 0) + count
+        with open(os.path.join(staging, name), "w", encoding="ascii") as f:
+            f.writelines(f"{suffix}:{shard[suffix]}\n" for suffix in sorted(shard))
+    for name in untouched:
+        try:
+            os.link(os.path.join(live, name), os.path.join(staging, name))
+        except OSError:
+            shutil.copy2(os.path.join(live, name), os.path.join(staging, name))
+    with open(os.path.join(staging, MARKER), "w", encoding="ascii") as f:
+        f.write(run_id)
+
+    # live -> .old, .new -> live; recover_buckets() finishes this if interrupted
+    if os.path.isdir(live):
+        os.rename(live, live + ".old")
+    os.rename(staging, live)
+    shutil.rmtree(live + ".old", ignore_errors=True)
+
+
+def read_marker(bucket_dir):
+    """Run id of the last merge into a bucket directory, or None"""
+    try:
+        with open(os.path.join(bucket_dir, MARKER), encoding="ascii") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def recover_buckets(root):
+    """Finish or discard bucket swaps that an interrupted build left behind"""
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if not os.path.isdir(path):
+            continue  # The manifest, or a .new directory already moved into place below
+        if name.endswith(".old"):
+            live = path[:-len(".old")]
+            if not os.path.isdir(live):
+                # Interrupted between the two renames; the staged copy is complete
+                os.rename(live + ".new", live)
+            shutil.rmtree(path)
+        elif name.endswith(".new") and not os.path.isdir(path[:-len(".new")] + ".old"):
+            shutil.rmtree(path)  # Interrupted while staging; the live bucket is untouched
+        elif name.startswith(SPILL_PREFIX):
+            shutil.rmtree(path)  # Spill files of an interrupted run are rebuilt on resume
+
+
+def import_dumps(root, run, log):
+    """Spill the dumps of a run by bucket and merge each bucket once"""
+    added = 0
+    with tempfile.TemporaryDirectory(prefix=SPILL_PREFIX, dir=root) as spill_dir:
+        spills = {}
+        try:
+            for dump in run['dumps']:
+                log.write(f"reading {dump}\n")
+                for digest, count in iter_dump_hashes(dump, run['format']):
+                    bucket = digest[:2]
+                    if bucket not in spills:
+                        spills[bucket] = open(os.path.join(spill_dir, bucket), "w+", encoding="ascii")
+                    spills[bucket].write(f"{digest}:{count}\n")
+                    added += 1
+            for bucket in sorted(spills):
+                spills[bucket].seek(0)
+                merge_bucket(root, bucket, spills[bucket], run['id'])
+        finally:
+            for spill in spills.values():
+                spill.close()
+    return added
+
+
+def source_stat(dump):
+    """What the manifest records to recognize a dump file again"""
+    stat = os.stat(dump)
+    return {'size': stat.st_size, 'mtime': int(stat.st_mtime)}
+
+
+def finish_run(root, manifest, run, log):
+    """Record a run as pending, merge it, then record its dumps as imported"""
+    manifest['pending'] = run
+    save_manifest(root, manifest)
+    added = import_dumps(root, run, log)
+    manifest['sources'].update(run['dumps'])
+    del manifest['pending']
+    save_manifest(root, manifest)
+    log.write(f"added {added} entries from {len(run['dumps'])} dump(s)\n")
+    return added
+
+
+def update_mirror(root, dumps, dump_format="auto", log=sys.stderr):
+    """Build or incrementally refresh the mirror at root from dump files
+
+    Dumps already recorded in the manifest are skipped, so re-running with a
+    growing download directory only adds the new files.  New entries are
+    first partitioned into 256 spill files by their first two hex digits,
+    then each spill is merged into its bucket, so memory stays bounded by
+    one spill rather than the whole dump.  The run is recorded in the
+    manifest before any bucket changes; if it is interrupted, the next call
+    resumes it and only merges the buckets it had not finished.  Raises
+    ValueError when a dump is missing or an interrupted run cannot resume.
+    """
+    os.makedirs(root, exist_ok=True)
+    recover_buckets(root)
+    manifest = load_manifest(root)
+    added = 0
+
+    run = manifest.get('pending')
+    if run is not None:
+        log.write(f"resuming interrupted import of {len(run['dumps'])} dump(s)\n")
+        for dump in run['dumps']:
+            if not os.path.isfile(dump):
+                raise ValueError(f"{dump} was removed during an interrupted import; "
+                                 "restore it or rebuild the mirror")
+            if source_stat(dump) != run['dumps'][dump]:
+                raise ValueError(f"{dump} changed during an interrupted import; rebuild the mirror")
+        added += finish_run(root, manifest, run, log)
+
+    pending = {}
+    for dump in dumps:
+        if not os.path.isfile(dump):
+            raise ValueError(f"{dump} does not exist")
+        key = os.path.abspath(dump)
+        known = manifest['sources'].get(key)
+        if known is None:
+            pending[key] = source_stat(dump)
+        elif known != source_stat(dump):
+            log.write(f"skipping {dump}: changed since it was added; rebuild the mirror to re-import it\n")
+    if pending:
+        run = {'id': os.urandom(8).hex(), 'format': dump_format, 'dumps': pending}
+        added += finish_run(root, manifest, run, log)
+    return added
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="PasswordClarity_breach",
+        description="Build and query a local breach-corpus mirror for offline checks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="create or refresh a mirror from dump files")
+    build.add_argument("mirror", help="mirror directory")
+    build.add_argument("dumps", nargs="+", help="downloaded dump files")
+    build.add_argument("--format", choices=["auto", "sha1", "plain"], default="auto",
+                       help="dump line format (default: auto)")
+
+    lookup = commands.add_parser("lookup", help="check passwords (read from stdin) against a mirror")
+    lookup.add_argument("mirror", help="mirror directory")
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        try:
+            update_mirror(args.mirror, args.dumps, args.format)
+        except ValueError as error:
+            parser.error(str(error))
+        return 0
+
+    mirror = open_breach_mirror(args.mirror)
+    if mirror is None:
+        parser.error(f"{args.mirror} is not a breach mirror (no {MANIFEST})")
+    for line in sys.stdin:
+        password = line.rstrip("\r\n")
+        if password:
+            print(mirror.count(password))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,922 @@
+import collections
+import functools
+import math
+import os
+import re
+import unicodedata
+
+KEYBOARD_PATTERNS = [
+    "qwerty", "qwertyuiop", "asdfghjkl", "zxcvbnm", "12345",
+    "abcde", "1qaz", "2wsx", "3edc", "4rfv", "5tgb", "6yhn"
+]
+SEQUENTIAL_NUMBERS = r'(012|123|234|345|456|567|678|789|890)'
+REPEATED_CHARACTERS = r'(.)\1{2,}'
+PERSONAL_PATTERNS = [
+    r'\b(19|20)\d{2}\b',  # Years
+    r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',  # Months
+    r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',  # Days
+    r'\b(password|login|admin|user|guest|test|demo)\b'  # Common words
+]
+
+# Guess numbers below this get a warning when a strength model is loaded
+GUESS_WARNING_LIMIT = 10 ** 10
+# With a model, the score is capped at this many points per power of ten guesses
+GUESS_SCORE_PER_DIGIT = 7
+
+# Colors for character types
+COLORS = {
+    'capital': "#00AA00",  # Green
+    'lower': "#0000AA",  # Blue
+    'number': "#AA0000",  # Red
+    'symbol': "#000000",  # Black
+    'confusable': "#FFD54F"  # Amber background for lookalike characters
+}
+
+# COLORS key for each character tag
+TAG_COLORS = {"uppercase": 'capital', "lowercase": 'lower', "digit": 'number', "symbol": 'symbol'}
+
+# Shown in place of line breaks in multi-line secrets (PEM blocks), one glyph per
+# character so display positions still match password positions
+LINE_BREAK = "↵"
+LINE_BREAKS = str.maketrans("\r\n", LINE_BREAK * 2)
+
+# ASCII characters that are easily confused with each other when read aloud or copied
+AMBIGUOUS_GROUPS = ["Il1|", "O0o", "S5", "Z2", "B8"]
+AMBIGUOUS_ASCII = {char: group for group in AMBIGUOUS_GROUPS for char in group}
+
+# bytes.translate table mapping every ASCII byte to its character class
+ASCII_CLASS_TABLE = bytes(
+    ord('U') if 65 <= b <= 90 else
+    ord('L') if 97 <= b <= 122 else
+    ord('D') if 48 <= b <= 57 else
+    ord('S')
+    for b in range(256))
+
+# Display tag for each ASCII character, indexed by code point
+CLASS_TAGS = {ord('U'): "uppercase", ord('L'): "lowercase", ord('D'): "digit", ord('S'): "symbol"}
+ASCII_TAGS = tuple(CLASS_TAGS[c] for c in ASCII_CLASS_TABLE[:128])
+
+# Non-ASCII characters that are easily mistaken for an ASCII character.
+# Full-width and mathematical forms are caught by NFKC in classify_char.
+CONFUSABLES = {
+    # Cyrillic
+    'А': 'A', 'В': 'B', 'Е': 'E', 'К': 'K', 'М': 'M', 'Н': 'H', 'О': 'O', 'Р': 'P',
+    'С': 'C', 'Т': 'T', 'Х': 'X', 'І': 'I', 'Ј': 'J', 'Ѕ': 'S', 'Ү': 'Y',
+    'а': 'a', 'е': 'e', 'о': 'o', 'р': 'p', 'с': 'c', 'у': 'y', 'х': 'x',
+    'і': 'i', 'ј': 'j', 'ѕ': 's', 'ԁ': 'd', 'һ': 'h', 'ӏ': 'l',
+    # Greek
+    'Α': 'A', 'Β': 'B', 'Ε': 'E', 'Ζ': 'Z', 'Η': 'H', 'Ι': 'I', 'Κ': 'K', 'Μ': 'M',
+    'Ν': 'N', 'Ο': 'O', 'Ρ': 'P', 'Τ': 'T', 'Υ': 'Y', 'Χ': 'X',
+    'ο': 'o', 'ν': 'v', 'ι': 'i', 'α': 'a', 'κ': 'k', 'ρ': 'p', 'υ': 'u',
+    # Latin lookalikes
+    'ı': 'i', 'ǀ': 'l', 'Ɩ': 'l', 'ɑ': 'a', 'ɡ': 'g', 'Ø': '0', 'ø': 'o',
+    # Punctuation
+    '‐': '-', '‑': '-', '‒': '-', '–': '-', '—': '-', '−': '-',
+    '‘': "'", '’': "'", '‚': ',', '“': '"', '”': '"', '„': '"',
+    '⁄': '/', '∕': '/', '∖': '\\', '․': '.', '˸': ':', '׃': ':',
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_non_ascii(char):
+    category = unicodedata.category(char)
+    if category in ("Lu", "Lt"):
+        tag = "uppercase"
+    elif category == "Ll":
+        tag = "lowercase"
+    elif category == "Nd":
+        tag = "digit"
+    else:
+        # Caseless letters (CJK, Arabic, ...) keep counting as symbols
+        tag = "symbol"
+
+    lookalike = CONFUSABLES.get(char)
+    if lookalike is None:
+        normalized = unicodedata.normalize("NFKC", char)
+        if len(normalized) == 1 and normalized.isascii() and normalized.isprintable():
+            lookalike = normalized
+        elif category in ("Cf", "Zs", "Zl", "Zp") or not normalized.strip():
+            lookalike = ""  # Invisible or blank: easy to paste without noticing
+    return tag, lookalike
+
+
+def classify_char(char):
+    """Return (tag, lookalike) for one character
+
+    tag is "uppercase", "lowercase", "digit" or "symbol" based on the Unicode
+    category, so "É" counts as a capital and full-width digits as numbers.
+    lookalike is the ASCII character a non-ASCII character can be mistaken
+    for ("" for invisible characters), or None when it is not confusable.
+    ASCII uses a precomputed table; other characters are cached.
+    """
+    code = ord(char)
+    if code < 128:
+        return ASCII_TAGS[code], None
+    return _classify_non_ascii(char)
+
+
+def count_char_classes(password):
+    """Return (capitals, lowers, numbers, symbols) for a password"""
+    if password.isascii():
+        classes = password.encode("ascii").translate(ASCII_CLASS_TABLE)
+        return classes.count(b'U'), classes.count(b'L'), classes.count(b'D'), classes.count(b'S')
+
+    counts = {"uppercase": 0, "lowercase": 0, "digit": 0, "symbol": 0}
+    for char in password:
+        counts[classify_char(char)[0]] += 1
+    return counts["uppercase"], counts["lowercase"], counts["digit"], counts["symbol"]
+
+
+class PasswordAnalyzer:
+    """Scoring and pattern checks shared by the GUI and headless tools"""
+
+    def __init__(self, breach_mirror=None, strength_model=None):
+        # Load word lists and common passwords
+        self.word_list = self.load_word_list()
+        self.symbol_list = ['@', '#', '$', '%', '&', '*', '!', '?', '>', '<', '+']
+        self.common_passwords = self.load_common_passwords()
+        self.breach_mirror = breach_mirror or self.load_breach_mirror()
+        self.strength_model = strength_model or self.load_strength_model()
+
+    def load_word_list(self):
+        """Load a comprehensive word list"""
+        # This is a sample word list - you can replace with your Excel word list
+        words = [
+            "abandon", "ability", "absence", "academy", "account", "accused", "achieve", "acquire", "address",
+            "advance",
+            "advocate", "african", "against", "already", "ancient", "another", "anxiety", "anybody", "application",
+            "approach",
+            "arrange", "article", "attempt", "attract", "auction", "average", "balance", "battery", "beneath",
+            "benefit",
+            "between", "bicycle", "brother", "brought", "builder", "burning", "cabinet", "caliber", "calcium",
+            "campaign",
+            "capable", "capacity", "capital", "captain", "capture", "careful", "carrier", "catalog", "ceiling",
+            "central",
+            "century", "certain", "chamber", "channel", "chapter", "charity", "chemical", "chicken", "circuit",
+            "citizen",
+            "classic", "climate", "clothes", "college", "combine", "comfort", "command", "comment", "company",
+            "compare",
+            "compile", "complex", "compute", "concept", "concern", "confirm", "connect", "consent", "consist",
+            "contact",
+            "contain", "content", "contest", "context", "control", "convert", "council", "counter", "country",
+            "courage",
+            "crystal", "culture", "current", "custody", "dealing", "decline", "default", "defense", "deliver",
+            "density",
+            "deposit", "desktop", "despite", "destroy", "diagram", "digital", "dignity", "diploma", "disable",
+            "disease",
+            "dismiss", "display", "dispute", "divorce", "domestic", "drawing", "dynamic", "eastern", "economy",
+            "element",
+            "enhance", "evening", "exclude", "execute", "exhibit", "explain", "explore", "extreme", "factory",
+            "failure",
+            "fantasy", "fashion", "feature", "federal", "finance", "finding", "fishing", "fitness", "foreign",
+            "formula",
+            "fortune", "forward", "freedom", "freight", "funeral", "gallery", "gateway", "general", "genetic",
+            "genuine",
+            "glimpse", "grocery", "growing", "habitat", "harmony", "heading", "hearing", "heating", "holiday",
+            "horizon",
+            "husband", "illegal", "imagery", "imagine", "immune", "impact", "improve", "initial", "inquiry", "insight",
+            "install", "instead", "intense", "interim", "involve", "journal", "journey", "justice", "justify",
+            "kitchen",
+            "landing", "largely", "leading", "learning", "leaving", "lecture", "leisure", "license", "limited",
+            "listing",
+            "logical", "loyalty", "machine", "manager", "mandate", "martial", "maximum", "meaning", "measure",
+            "medical",
+            "meeting", "mental", "message", "mineral", "minimal", "minimum", "mission", "mistake", "mixture", "monitor",
+            "morning", "musical", "mystery", "natural", "neither", "network", "neutral", "nuclear", "nursing",
+            "obvious",
+            "offense", "opening", "operate", "opinion", "optimal", "organic", "outline", "outlook", "overall",
+            "overlap",
+            "package", "parking", "partial", "partner", "passion", "patient", "pattern", "payment", "penalty",
+            "pending",
+            "perfect", "perform", "perhaps", "phantom", "picture", "plastic", "platform", "popular", "portion",
+            "poverty",
+            "precise", "predict", "premium", "prepare", "present", "prevent", "primary", "privacy", "private",
+            "problem",
+            "process", "produce", "product", "profile", "project", "promise", "promote", "protect", "provide",
+            "publish",
+            "purpose", "qualify", "quality", "quarter", "radical", "railway", "rainbow", "random", "readily", "reality",
+            "receipt", "receive", "recover", "reflect", "regular", "related", "release", "relevant", "remain",
+            "removal",
+            "replace", "request", "require", "rescue", "reserve", "respect", "respond", "restore", "revenue", "reverse",
+            "routine", "science", "scratch", "section", "segment", "serious", "service", "session", "setting",
+            "shelter",
+            "silence", "similar", "smoking", "society", "somehow", "speaker", "special", "station", "storage",
+            "strange",
+            "stretch", "student", "subject", "success", "suggest", "summary", "support", "suppose", "supreme",
+            "surface",
+            "survive", "suspect", "sustain", "symptom", "tactics", "teacher", "theater", "therapy", "through",
+            "tonight",
+            "traffic", "training", "transit", "trouble", "uniform", "unique", "unknown", "upgrade", "utility",
+            "variety",
+            "vehicle", "venture", "version", "village", "virtual", "visible", "vitamin", "welfare", "western",
+            "whisper",
+            "willing", "windows", "winning", "wireless", "witness", "working", "writing", "written", "achieve",
+            "blanket",
+            "brother", "cabinet", "channel", "command", "crystal", "diamond", "digital", "drawing", "element",
+            "evening",
+            "explore", "factory", "fishing", "freedom", "gallery", "genetic", "harvest", "heading", "install",
+            "journey",
+            "kitchen", "landing", "machine", "manager", "morning", "mystery", "network", "operate", "package",
+            "parking",
+            "perfect", "picture", "plastic", "popular", "present", "primary", "privacy", "problem", "protect",
+            "publish",
+            "railway", "reality", "regular", "replace", "request", "science", "section", "service", "setting",
+            "similar",
+            "society", "station", "strange", "student", "suggest", "support", "surface", "teacher", "theater",
+            "through",
+            "tonight", "traffic", "trouble", "uniform", "upgrade", "utility", "variety", "vehicle", "venture",
+            "version",
+            "village", "virtual", "visible", "welfare", "western", "willing", "windows", "winning", "witness",
+            "working",
+            "writing", "written", "abandon", "ability", "absence", "academy", "account", "accused", "acquire",
+            "address",
+            "advance", "advocate", "african", "against", "already", "ancient", "another", "anxiety", "anybody",
+            "attempt",
+            "attract", "auction", "average", "balance", "battery", "beneath", "benefit", "between", "bicycle",
+            "brought",
+            "builder", "burning", "calcium", "campaign", "capable", "capacity", "capital", "captain", "capture",
+            "careful",
+            "carrier", "catalog", "ceiling", "central", "century", "certain", "chamber", "chapter", "charity",
+            "chemical",
+            "chicken", "circuit", "citizen", "classic", "climate", "clothes", "college", "combine", "comfort",
+            "comment",
+            "company", "compare", "compile", "complex", "compute", "concept", "concern", "confirm", "connect",
+            "consent",
+            "consist", "contact", "contain", "content", "contest", "context", "control", "convert", "council",
+            "counter",
+            "country", "courage", "culture", "current", "custody", "dealing", "decline", "default", "defense",
+            "deliver",
+            "density", "deposit", "desktop", "despite", "destroy", "diagram", "dignity", "diploma", "disable",
+            "disease",
+            "dismiss", "display", "dispute", "divorce", "domestic", "dynamic", "eastern", "economy", "enhance",
+            "evening",
+            "exclude", "execute", "exhibit", "explain", "extreme", "failure", "fantasy", "fashion", "feature",
+            "federal",
+            "finance", "finding", "fitness", "foreign", "formula", "fortune", "forward", "freight", "funeral",
+            "gateway",
+            "general", "genuine", "glimpse", "grocery", "growing", "habitat", "harmony", "hearing", "heating",
+            "holiday",
+            "horizon", "husband", "illegal", "imagery", "imagine", "immune", "impact", "improve", "initial", "inquiry",
+            "insight", "instead", "intense", "interim", "involve", "journal", "justice", "justify", "largely",
+            "leading",
+            "learning", "leaving", "lecture", "leisure", "license", "limited", "listing", "logical", "loyalty",
+            "mandate",
+            "martial", "maximum", "meaning", "measure", "medical", "meeting", "mental", "message", "mineral", "minimal",
+            "minimum", "mission", "mistake", "mixture", "monitor", "musical", "natural", "neither", "neutral",
+            "nuclear",
+            "nursing", "obvious", "offense", "opening", "opinion", "optimal", "organic", "outline", "outlook",
+            "overall",
+            "overlap", "partial", "partner", "passion", "patient", "pattern", "payment", "penalty", "pending",
+            "perform",
+            "perhaps", "phantom", "portion", "poverty", "precise", "predict", "premium", "prepare", "prevent",
+            "privacy",
+            "private", "process", "produce", "product", "profile", "project", "promise", "promote", "provide",
+            "purpose",
+            "qualify", "quality", "quarter", "radical", "railway", "rainbow", "random", "readily", "receipt", "receive",
+            "recover", "reflect", "related", "release", "relevant", "remain", "removal", "require", "rescue", "reserve",
+            "respect", "respond", "restore", "revenue", "reverse", "routine", "scratch", "segment", "serious",
+            "session",
+            "shelter", "silence", "smoking", "somehow", "speaker", "special", "storage", "stretch", "subject",
+            "success",
+            "summary", "suppose", "supreme", "survive", "suspect", "sustain", "symptom", "tactics", "therapy",
+            "training",
+            "transit", "unique", "unknown", "village", "virtual", "visible", "vitamin", "welfare", "western", "whisper",
+            "willing", "windows", "winning", "wireless", "witness", "working", "writing", "written"
+        ]
+        return words
+
+    def load_common_passwords(self):
+        """Load common passwords for checking"""
+        # This is a sample list - you can expand this with more comprehensive lists
+        common = [
+            "123456", "password", "123456789", "12345678", "12345", "1234567", "1234567890",
+            "qwerty", "abc123", "password1", "111111", "123123", "admin", "letmein", "welcome",
+            "monkey", "1234", "dragon", "master", "login", "princess", "solo", "sunshine",
+            "passw0rd", "football", "baseball", "jordan", "freedom", "batman", "trustno1",
+            "password123", "welcome1", "hello", "charlie", "access", "shadow", "flower",
+            "123qwe", "iloveyou", "superman", "whatever", "killer", "summer", "michael",
+            "ranger", "lovely", "babygirl", "ashley", "nicole", "cheese", "computer",
+            "soccer", "internet", "service", "canada", "hello123", "guest", "buster",
+            "test", "love", "0000", "2000", "jordan23", "eagle1", "pass", "fuckme",
+            "badboy", "hunter", "test123", "cricket", "pass@word1", "changeme", "secret",
+            "orange", "fuckyou", "starwars", "password!", "Password", "Password1",
+            "Password123", "password@123", "p@ssw0rd", "P@ssw0rd", "P@ssword",
+            "password1!", "qwertyuiop", "asdfghjkl", "zxcvbnm", "qwerty123",
+            "123456a", "a123456", "password12", "admin123", "root", "toor",
+            "administrator", "default", "guest123", "user", "temp", "demo"
+        ]
+        return set(common)
+
+    def load_breach_mirror(self):
+        """Open the local breach-corpus mirror, if one is configured"""
+        # Set PASSWORD_CLARITY_BREACH_MIRROR to a directory built with PasswordClarity_breach.py
+        if not os.environ.get("PASSWORD_CLARITY_BREACH_MIRROR"):
+            return None  # Don't pay for importing the mirror code when none is configured
+        from PasswordClarity_breach import open_breach_mirror
+        return open_breach_mirror()
+
+    def load_strength_model(self):
+        """Open the guess-number model, if one is configured"""
+        # Set PASSWORD_CLARITY_MODEL to a file trained with PasswordClarity_markov.py
+        if not os.environ.get("PASSWORD_CLARITY_MODEL"):
+            return None
+        from PasswordClarity_markov import open_strength_model
+        return open_strength_model()
+
+    def guess_number(self, password):
+        """Estimated guesses a model-based cracker needs, or None without a model"""
+        if self.strength_model is None or not password:
+            return None
+        return self.strength_model.guesses(password)
+
+    def guess_warning(self, guesses):
+        """Return the warning for a low guess number, or None"""
+        if guesses is None or guesses >= GUESS_WARNING_LIMIT:
+            return None
+        return f"WARNING: Predictable to guessing models (about 10^{int(math.log10(guesses))} guesses)"
+
+    def breach_warning(self, password):
+        """Return the breach-corpus warning for password, or None"""
+        if self.breach_mirror is None or not password:
+            return None
+        count = self.breach_mirror.count(password)
+        if count:
+            return f"WARNING: Found in breach corpus ({count:,} {'time' if count == 1 else 'times'})"
+        return None
+
+    def check_common_patterns(self, password):
+        """Check for common password patterns and weaknesses"""
+        return list(self.iter_warnings(password))
+
+    def iter_warnings(self, password):
+        """Yield warnings lazily, most important first
+
+        Callers that only show a few warnings can stop early (for example
+        with itertools.islice) and the remaining checks never run.
+        """
+        yield from self.iter_penalty_warnings(password)
+        yield from self.iter_advisory_warnings(password)
+
+    def iter_penalty_warnings(self, password):
+        """Yield the warnings that reduce the strength score"""
+        password_lower = password.lower()
+
+        # Check against common passwords, then the breach corpus
+        if password_lower in self.common_passwords:
+            yield "WARNING: This is a commonly used password"
+        else:
+            warning = self.breach_warning(password)
+            if warning:
+                yield warning
+
+        # Check the estimated guess number
+        warning = self.guess_warning(self.guess_number(password))
+        if warning:
+            yield warning
+
+        # Check for keyboard patterns
+        for pattern in KEYBOARD_PATTERNS:
+            if pattern in password_lower:
+                yield "WARNING: Contains keyboard pattern"
+                break
+
+        # Check for sequential numbers
+        if re.search(SEQUENTIAL_NUMBERS, password):
+            yield "WARNING: Contains sequential numbers"
+
+        # Check for repeated characters
+        if re.search(REPEATED_CHARACTERS, password):
+            yield "WARNING: Contains repeated characters"
+
+        # Check for dictionary words
+        for word in self.word_list:
+            if len(word) > 3 and word.lower() in password_lower:
+                yield "WARNING: Contains dictionary word"
+                break
+
+    def iter_advisory_warnings(self, password):
+        """Yield warnings and tips that do not affect the score"""
+        # Check for personal info patterns
+        for pattern in PERSONAL_PATTERNS:
+            if re.search(pattern, password.lower()):
+                yield "WARNING: Contains predictable pattern"
+                break
+
+        # Check for insufficient length
+        if len(password) < 8:
+            yield "WARNING: Password is too short (minimum 8 characters)"
+
+        # Check for missing character types
+        if not password:
+            return
+        capitals, lowers, numbers, symbols = count_char_classes(password)
+        if not capitals:
+            yield "TIP: Consider adding uppercase letters"
+        if not lowers:
+            yield "TIP: Consider adding lowercase letters"
+        if not numbers:
+            yield "TIP: Consider adding numbers"
+        if not symbols:
+            yield "TIP: Consider adding symbols"
+
+    def get_password_strength(self, password):
+        """Calculate password strength and character counts"""
+        if not password:
+            return {
+                'score': 0,
+                'capitals': 0,
+                'lowers': 0,
+                'numbers': 0,
+                'symbols': 0
+            }
+
+        # Count character types
+        capitals, lowers, numbers, symbols = count_char_classes(password)
+        length = len(password)
+
+        return self.score_counts(capitals, lowers, numbers, symbols, length,
+                                 self.iter_penalty_warnings(password),
+                                 self.guess_number(password))
+
+    def score_counts(self, capitals, lowers, numbers, symbols, length, penalty_warnings,
+                     guesses=None):
+        """Turn character counts and penalty warnings into a strength result
+
+        With a strength model, guesses is the estimated guess number and caps
+        the score, so a password that only looks varied ("Password1!") cannot
+        score well.  It is returned as 'guesses' so callers need not score the
+        password again.
+        """
+        # Basic scoring algorithm
+        score = 0
+
+        # Length points (up to 40 points)
+        score += min(length * 3, 40)
+
+        # Character type points
+        if capitals > 0:
+            score += min(capitals * 2, 10)
+        if lowers > 0:
+            score += min(lowers * 2, 10)
+        if numbers > 0:
+            score += min(numbers * 2, 10)
+        if symbols > 0:
+            score += min(symbols * 3, 15)
+
+        # Bonus for mixture of character types (up to 20 points)
+        types_used = 0
+        if capitals > 0:
+            types_used += 1
+        if lowers > 0:
+            types_used += 1
+        if numbers > 0:
+            types_used += 1
+        if symbols > 0:
+            types_used += 1
+        score += types_used * 5
+
+        # Penalty for common passwords and patterns
+        penalty = 0
+        for warning in penalty_warnings:
+            if "commonly used" in warning or "breach corpus" in warning:
+                penalty += 30
+            elif "keyboard pattern" in warning or "sequential" in warning:
+                penalty += 15
+            elif "repeated characters" in warning:
+                penalty += 10
+            elif "dictionary word" in warning:
+                penalty += 5
+
+        score = max(0, score - penalty)
+
+        # Cap by how quickly a model-based cracker would reach it
+        if guesses is not None:
+            score = min(score, int(math.log10(max(guesses, 1)) * GUESS_SCORE_PER_DIGIT))
+
+        result = {
+            'score': min(score, 100),
+            'capitals': capitals,
+            'lowers': lowers,
+            'numbers': numbers,
+            'symbols': symbols
+        }
+        if guesses is not None:
+            result['guesses'] = guesses
+        return result
+
+
+class AsciiBytesAnalyzer:
+    """Run the PasswordAnalyzer checks directly on ASCII bytes
+
+    Bulk audits read raw buffers; for ASCII lines this gives the same results
+    as the str path without decoding each line.  Character counts come from a
+    single bytes.translate into class letters and the pattern checks use
+    precompiled bytes regexes.  Callers must send non-ASCII lines through the
+    str path (see analyze_line).
+    """
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.common_passwords = {p.encode("ascii") for p in analyzer.common_passwords
+                                 if p.isascii()}
+        self.keyboard_patterns = self.literal_regex(KEYBOARD_PATTERNS)
+        self.dictionary_words = self.literal_regex(
+            w.lower() for w in analyzer.word_list if len(w) > 3)
+        self.sequential = re.compile(SEQUENTIAL_NUMBERS.encode("ascii"))
+        self.repeated = re.compile(REPEATED_CHARACTERS.encode("ascii"))
+        self.personal = [re.compile(p.encode("ascii")) for p in PERSONAL_PATTERNS]
+
+    @staticmethod
+    def literal_regex(literals):
+        """Compile ASCII literals into one bytes alternation, searched in a single C call"""
+        literals = sorted({literal.encode("ascii") for literal in literals if literal.isascii()})
+        return re.compile(b"|".join(re.escape(literal) for literal in literals))
+
+    def iter_penalty_warnings(self, password, password_lower, guesses=None):
+        """Bytes version of PasswordAnalyzer.iter_penalty_warnings"""
+        if password_lower in self.common_passwords:
+            yield "WARNING: This is a commonly used password"
+        else:
+            # Breach corpora hash the raw bytes, so no decoding is needed here either
+            warning = self.analyzer.breach_warning(password)
+            if warning:
+                yield warning
+
+        # The strength model also works on bytes
+        warning = self.analyzer.guess_warning(guesses)
+        if warning:
+            yield warning
+
+        if self.keyboard_patterns.search(password_lower):
+            yield "WARNING: Contains keyboard pattern"
+
+        if self.sequential.search(password):
+            yield "WARNING: Contains sequential numbers"
+
+        if self.repeated.search(password):
+            yield "WARNING: Contains repeated characters"
+
+        if self.dictionary_words.search(password_lower):
+            yield "WARNING: Contains dictionary word"
+
+    def analyze(self, password):
+        """Return (strength, warnings) for one ASCII password given as bytes"""
+        if not password:
+            return self.analyzer.get_password_strength(""), self.analyzer.check_common_patterns("")
+
+        password_lower = password.lower()
+        classes = password.translate(ASCII_CLASS_TABLE)
+        capitals = classes.count(b'U')
+        lowers = classes.count(b'L')
+        numbers = classes.count(b'D')
+        symbols = classes.count(b'S')
+
+        guesses = self.analyzer.guess_number(password)
+        penalty_warnings = list(self.iter_penalty_warnings(password, password_lower, guesses))
+        strength = self.analyzer.score_counts(capitals, lowers, numbers, symbols,
+                                              len(password), penalty_warnings, guesses)
+
+        warnings = penalty_warnings
+        for pattern in self.personal:
+            if pattern.search(password_lower):
+                warnings.append("WARNING: Contains predictable pattern")
+                break
+        if len(password) < 8:
+            warnings.append("WARNING: Password is too short (minimum 8 characters)")
+        if not capitals:
+            warnings.append("TIP: Consider adding uppercase letters")
+        if not lowers:
+            warnings.append("TIP: Consider adding lowercase letters")
+        if not numbers:
+            warnings.append("TIP: Consider adding numbers")
+        if not symbols:
+            warnings.append("TIP: Consider adding symbols")
+
+        return strength, warnings
+
+    def analyze_line(self, line):
+        """Analyze a raw line, decoding it only when it is not pure ASCII"""
+        if line.isascii():
+            return self.analyze(line)
+        password = line.decode("utf-8", "surrogateescape")
+        return (self.analyzer.get_password_strength(password),
+                self.analyzer.check_common_patterns(password))
+
+
+class PatternAutomaton:
+    """Aho-Corasick automaton reporting which pattern groups end at each step
+
+    Each pattern carries a bit; output[state] is the OR of the bits of every
+    pattern ending in that state, so one pass (or one step per appended
+    character) finds all substring matches regardless of how many patterns
+    there are.
+    """
+
+    def __init__(self, groups):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [0]
+        for bit, patterns in groups:
+            for pattern in patterns:
+                state = 0
+                for char in pattern:
+                    if char not in self.goto[state]:
+                        self.goto.append({})
+                        self.fail.append(0)
+                        self.output.append(0)
+                        self.goto[state][char] = len(self.goto) - 1
+                    state = self.goto[state][char]
+                self.output[state] |= bit
+
+        # Breadth-first pass to fill in failure links
+        queue = collections.deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] |= self.output[self.fail[child]]
+
+    def step(self, state, char):
+        """Return the state after reading char"""
+        while state and char not in self.goto[state]:
+            state = self.fail[state]
+        return self.goto[state].get(char, 0)
+
+
+def _is_word_char(char):
+    """Same test as \\w in a str regex"""
+    return char.isalnum() or char == "_"
+
+
+class IncrementalAnalyzer:
+    """PasswordAnalyzer results kept up to date one appended character at a time
+
+    Typing mostly appends, so instead of rescanning the whole password this
+    keeps running class counts, the position in a trie of common passwords,
+    an Aho-Corasick state for keyboard patterns and dictionary words, and
+    small trackers for repeats, sequences and the predictable-pattern
+    regexes (checked on a short tail).  Each appended character costs O(1)
+    amortized.  The state is also saved every CHECKPOINT_INTERVAL
+    characters, so any other edit (delete, paste in the middle) replays only
+    from the last checkpoint before it.  Results are identical to
+    PasswordAnalyzer's.
+    """
+
+    KEYBOARD, DICTIONARY = 1, 2
+    TAIL_LENGTH = 16  # Longer than any predictable pattern plus one character
+    CHECKPOINT_INTERVAL = 256
+    # Everything append() updates besides counts, saved at each checkpoint
+    STATE = ("common_node", "pattern_state", "found", "sequential", "repeated", "run_char",
+             "run_length", "recent", "tail", "personal_confirmed", "personal_pending",
+             "model_cost", "model_context")
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.automaton = PatternAutomaton([
+            (self.KEYBOARD, KEYBOARD_PATTERNS),
+            (self.DICTIONARY, [w.lower() for w in analyzer.word_list if len(w) > 3]),
+        ])
+        # Plain trie of common passwords; the key None marks a complete password
+        self.common_trie = {}
+        for common in analyzer.common_passwords:
+            if common == common.lower():
+                node = self.common_trie
+                for char in common:
+                    node = node.setdefault(char, {})
+                node[None] = True
+        self.sequences = set(SEQUENTIAL_NUMBERS[1:-1].split("|"))
+
+        # End-anchored forms of PERSONAL_PATTERNS: (regex, has trailing \\b)
+        self.personal = []
+        for pattern in PERSONAL_PATTERNS:
+            trailing = pattern.endswith(r'\b')
+            body = pattern[2:-2] if trailing else pattern[2:]
+            self.personal.append((re.compile(r'(?<!\w)' + body + r'\Z'), trailing))
+
+        self.breach_checked = (None, None)  # (password, warning) of the last lookup
+        self.model = analyzer.strength_model
+        self.reset()
+
+    def reset(self):
+        """Forget the current password"""
+        self.password = ""
+        self.counts = {"uppercase": 0, "lowercase": 0, "digit": 0, "symbol": 0}
+        self.common_node = self.common_trie  # None once the password left the trie
+        self.pattern_state = 0
+        self.found = 0  # KEYBOARD | DICTIONARY bits seen so far
+        self.sequential = False
+        self.repeated = False
+        self.run_char, self.run_length = "", 0
+        self.recent = ""  # Last three characters, original case
+        self.tail = ""  # Last TAIL_LENGTH lowercased characters
+        self.personal_confirmed = False
+        self.personal_pending = False
+        self.model_cost, self.model_context = 0, 0  # Running strength-model cost
+        self.checkpoints = [self.checkpoint()]  # State after each CHECKPOINT_INTERVAL characters
+
+    def checkpoint(self):
+        """Return a copy of the tracker state"""
+        return dict(self.counts), tuple(getattr(self, name) for name in self.STATE)
+
+    def restore(self, password):
+        """Rewind to the last checkpoint that password shares with the current password"""
+        interval = self.CHECKPOINT_INTERVAL
+        index = 0
+        while (index + 1 < len(self.checkpoints)
+               and self.password[index * interval:(index + 1) * interval]
+               == password[index * interval:(index + 1) * interval]):
+            index += 1
+        counts, state = self.checkpoints[index]
+        del self.checkpoints[index + 1:]
+        self.counts = dict(counts)
+        for name, value in zip(self.STATE, state):
+            setattr(self, name, value)
+        self.password = password[:index * interval]
+
+    def sync(self, password):
+        """Bring the state up to date with password"""
+        if password == self.password:
+            return
+        if not password.startswith(self.password):
+            self.restore(password)
+        interval = self.CHECKPOINT_INTERVAL
+        position = len(self.password)
+        while position < len(password):
+            end = min(len(password), (position // interval + 1) * interval)
+            for char in password[position:end]:
+                self.append(char)
+            position = end
+            if position == interval * len(self.checkpoints):
+                self.checkpoints.append(self.checkpoint())
+        self.password = password
+
+    def append(self, char):
+        """Update every tracker for one appended character (sync sets self.password)"""
+        self.counts[classify_char(char)[0]] += 1
+
+        if self.model is not None:
+            cost, self.model_context = self.model.step(self.model_context, char)
+            self.model_cost += cost
+
+        # Sequential numbers and repeated characters look at the original case
+        self.recent = self.recent[-2:] + char
+        if not self.sequential and self.recent in self.sequences:
+            self.sequential = True
+        if char == self.run_char:
+            self.run_length += 1
+        else:
+            self.run_char, self.run_length = char, 1
+        if self.run_length >= 3 and char != "\n":
+            self.repeated = True
+
+        for lower in char.lower():
+            if self.common_node is not None:
+                self.common_node = self.common_node.get(lower)
+            self.pattern_state = self.automaton.step(self.pattern_state, lower)
+            self.found |= self.automaton.output[self.pattern_state]
+
+            # A pending match with a trailing \\b is confirmed by a non-word character
+            if self.personal_pending and not _is_word_char(lower):
+                self.personal_confirmed = True
+            self.tail = (self.tail + lower)[-self.TAIL_LENGTH:]
+            self.personal_pending = False
+            if not self.personal_confirmed:
+                for regex, trailing in self.personal:
+                    if regex.search(self.tail):
+                        if trailing:
+                            self.personal_pending = True
+                        else:
+                            self.personal_confirmed = True
+
+    def iter_penalty_warnings(self, password):
+        """Incremental version of PasswordAnalyzer.iter_penalty_warnings"""
+        self.sync(password)
+        if self.common_node is not None and None in self.common_node:
+            yield "WARNING: This is a commonly used password"
+        elif self.analyzer.breach_mirror is not None:
+            # One hash per distinct password; the shard itself is cached by the mirror
+            if self.breach_checked[0] != password:
+                self.breach_checked = (password, self.analyzer.breach_warning(password))
+            if self.breach_checked[1]:
+                yield self.breach_checked[1]
+        warning = self.analyzer.guess_warning(self.guess_number(password))
+        if warning:
+            yield warning
+        if self.found & self.KEYBOARD:
+            yield "WARNING: Contains keyboard pattern"
+        if self.sequential:
+            yield "WARNING: Contains sequential numbers"
+        if self.repeated:
+            yield "WARNING: Contains repeated characters"
+        if self.found & self.DICTIONARY:
+            yield "WARNING: Contains dictionary word"
+
+    def guess_number(self, password):
+        """Incremental version of PasswordAnalyzer.guess_number"""
+        self.sync(password)
+        if self.model is None or not password:
+            return None
+        return self.model.guesses_for_cost(
+            self.model_cost + self.model.end_cost(self.model_context))
+
+    def iter_advisory_warnings(self, password):
+        """Incremental version of PasswordAnalyzer.iter_advisory_warnings"""
+        self.sync(password)
+        if self.personal_confirmed or self.personal_pending:
+            yield "WARNING: Contains predictable pattern"
+        if len(password) < 8:
+            yield "WARNING: Password is too short (minimum 8 characters)"
+        if not password:
+            return
+        if not self.counts["uppercase"]:
+            yield "TIP: Consider adding uppercase letters"
+        if not self.counts["lowercase"]:
+            yield "TIP: Consider adding lowercase letters"
+        if not self.counts["digit"]:
+            yield "TIP: Consider adding numbers"
+        if not self.counts["symbol"]:
+            yield "TIP: Consider adding symbols"
+
+    def iter_warnings(self, password):
+        """Yield warnings lazily, most important first"""
+        yield from self.iter_penalty_warnings(password)
+        yield from self.iter_advisory_warnings(password)
+
+    def check_common_patterns(self, password):
+        """Check for common password patterns and weaknesses"""
+        return list(self.iter_warnings(password))
+
+    def get_password_strength(self, password):
+        """Calculate password strength and character counts"""
+        if not password:
+            return self.analyzer.get_password_strength(password)
+        self.sync(password)
+        return self.analyzer.score_counts(
+            self.counts["uppercase"], self.counts["lowercase"], self.counts["digit"],
+            self.counts["symbol"], len(password), self.iter_penalty_warnings(password),
+            self.guess_number(password))
+
+
+# Passphrase shapes from the original Excel formulas (w = word, W = WORD,
+# n = number 10-99, s = symbol):
+# Formula 1: word + num + symbol + WORD + symbol + word + num
+# =INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99)&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1))&UPPER(INDEX(WordList!A:A,RANDBETWEEN(1,1500),1))&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99))
+# Formula 2: word + symbol + WORD + num + symbol + word + num
+# =INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&UPPER(INDEX(WordList!A:A,RANDBETWEEN(1,1500),1))&(RANDBETWEEN(10,99))&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99))
+# Formula 3: word + num + symbol + WORD + num + symbol + word
+# =INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99)&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1))&UPPER(INDEX(WordList!A:A,RANDBETWEEN(1,1500),1))&(RANDBETWEEN(10,99))&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)
+PASSPHRASE_TEMPLATES = ["wnsWswn", "wsWnswn", "wnsWnsw"]
+
+
+def make_passphrase(rng, word_list, symbol_list, template=None):
+    """Fill a passphrase template (random if not given) using rng, e.g. the random module"""
+    parts = []
+    for slot in template or rng.choice(PASSPHRASE_TEMPLATES):
+        if slot == "w":
+            parts.append(rng.choice(word_list))
+        elif slot == "W":
+            parts.append(rng.choice(word_list).upper())
+        elif slot == "n":
+            parts.append(str(rng.randint(10, 99)))
+        else:
+            parts.append(rng.choice(symbol_list))
+    return "".join(parts)
+
+
+# Characters commonly substituted for letters ("p@ssw0rd", "adm1n")
+LEET_TABLE = str.maketrans({
+    '0': 'o', '1': 'i', '3': 'e', '4': 'a', '5': 's', '7': 't', '8': 'b', '9': 'g',
+    '@': 'a', '$': 's', '!': 'i', '+': 't', '|': 'l'
+})
+LEET_CHARS = frozenset('01345789@$!+|')
+
+# Letter runs and the digit/symbol gaps between them
+SKELETON_SPLIT = re.compile(r'([^\W\d_]+)')
+
+
+def password_skeleton(password):
+    """Reduce a password to its base letters so near-duplicates compare equal
+
+    The password is lowercased, leetspeak inside a word is undone
+    ("P@ssw0rd" -> "password") and every other digit or symbol is dropped, so
+    "Summer2023!", "summer#24" and "SUMMER99" share the skeleton "summer".
+    A gap between two letter runs of 4+ letters is treated as a separator
+    rather than leetspeak, which keeps generated passphrases such as
+    "forward12#CAPTAIN$morning" grouped regardless of the symbols chosen.
+    """
+    parts = SKELETON_SPLIT.split(password.lower())
+    # parts alternates gap, letters, gap, ... and always starts/ends with a gap
+    skeleton = []
+    for i in range(1, len(parts), 2):
+        skeleton.append(parts[i])
+        if i + 2 >= len(parts):
+            break
+        gap = parts[i + 1]
+        if (gap and all(c in LEET_CHARS for c in gap)
+                and (len(parts[i]) < 4 or len(parts[i + 2]) < 4)):
+            skeleton.append(gap.translate(LEET_TABLE))
+    return "".join(skeleton)
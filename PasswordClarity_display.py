@@ -0,0 +1,247 @@
+import itertools
+import math
+import os
+import sys
+import time
+import tkinter as tk
+
+from PasswordClarity_core import LINE_BREAKS, classify_char
+
+CLASS_TAGS = ("uppercase", "lowercase", "digit", "symbol", "confusable")
+
+
+class VirtualizedDisplay:
+    """Colour-coded password display that only tags what is on screen
+
+    Takes over the xscrollcommand of a single-line Text widget and the
+    command of its horizontal scrollbar.  The Text holds at most chunk_size
+    characters of the password, inserted untagged in one call with line
+    breaks shown as a glyph so it stays one line; colour tags
+    are applied as one range per run of same-class characters, and only for
+    the visible columns plus a margin.  Scrolling retags the new window, and
+    scrolling past the loaded chunk swaps in the next one, while the
+    scrollbar always reflects the position in the whole password.
+    """
+
+    def __init__(self, text, scrollbar, chunk_size=4096, margin=64):
+        self.text = text
+        self.scrollbar = scrollbar
+        self.chunk_size = chunk_size
+        self.margin = margin
+
+        self.password = ""
+        self.offset = 0  # Index in the password of the first loaded character
+        self.chunk = ""
+        self.tagged = (0, 0)  # Chunk-relative range that currently has tags
+
+        self.text.configure(xscrollcommand=self.on_text_scroll)
+        self.scrollbar.configure(command=self.on_scrollbar)
+
+    def show(self, password):
+        """Display a new password, keeping the view where the user is working
+
+        When the new password only extends the old one and the end was in
+        view (typing, pasting at the end), the view follows the end;
+        otherwise it stays on the same first character.
+        """
+        previous = self.password
+        first, last = self.visible_range()
+        self.password = password
+        if password.startswith(previous) and self.offset + last >= len(previous):
+            self.load_chunk(self.chunk_offset(len(password)), 1.0)
+            return
+
+        target = min(self.offset + first, max(0, len(password) - 1))
+        offset = self.chunk_offset(target)
+        shown = min(self.chunk_size, len(password) - offset)
+        self.load_chunk(offset, (target - offset) / max(1, shown))
+
+    def load_chunk(self, offset, position=0.0):
+        """Fill the Text with the chunk of the password starting at offset, viewed at position"""
+        self.offset = offset
+        self.chunk = self.password[offset:offset + self.chunk_size]
+        self.tagged = (0, 0)
+
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        if self.chunk:
+            # Line breaks become glyphs: the Text must stay one line for "1.N" indexes
+            self.text.insert("1.0", self.chunk.translate(LINE_BREAKS))
+            # Center the text
+            self.text.tag_add("center", "1.0", "end")
+            self.text.tag_configure("center", justify='center')
+        self.text.config(state=tk.DISABLED)
+        self.text.xview_moveto(position)
+        self.tag_visible()
+
+    def visible_range(self):
+        """Return the chunk-relative (first, last) visible character indexes"""
+        first, last = self.text.xview()
+        return int(first * len(self.chunk)), math.ceil(last * len(self.chunk))
+
+    def tag_visible(self):
+        """Apply colour tags to the visible window, coalescing runs"""
+        first, last = self.visible_range()
+        start = max(0, first - self.margin)
+        end = min(len(self.chunk), last + self.margin)
+        if self.tagged[0] <= start and end <= self.tagged[1]:
+            return
+
+        for tag in CLASS_TAGS:
+            self.text.tag_remove(tag, "1.0", tk.END)
+
+        position = start
+        runs = itertools.groupby(self.chunk[start:end], key=classify_char)
+        for (tag, lookalike), chars in runs:
+            length = sum(1 for _ in chars)
+            run_start, run_end = f"1.{position}", f"1.{position + length}"
+            self.text.tag_add(tag, run_start, run_end)
+            if lookalike is not None:
+                self.text.tag_add("confusable", run_start, run_end)
+            position += length
+        self.tagged = (start, end)
+
+    def on_text_scroll(self, first, last):
+        """Keep tags and the scrollbar in step with the Text's view"""
+        first, last = float(first), float(last)
+        total = len(self.password)
+        if not total:
+            self.scrollbar.set(0, 1)
+            return
+
+        # Swap in the neighbouring chunk when the view reaches a loaded edge
+        shown = len(self.chunk)
+        at_start = first <= 0 and self.offset > 0
+        at_end = last >= 1 and first > 0 and self.offset + shown < total
+        if (at_start or at_end) and self.recenter(self.offset + first * shown):
+            return
+
+        self.scrollbar.set((self.offset + first * shown) / total,
+                           (self.offset + last * shown) / total)
+        self.tag_visible()
+
+    def on_scrollbar(self, action, amount, unit=None):
+        """Translate scrollbar commands into positions in the whole password"""
+        total = len(self.password)
+        if not total:
+            return
+        first, last = self.visible_range()
+        if action == "moveto":
+            target = float(amount) * total
+        elif unit == "pages":
+            target = self.offset + first + int(amount) * max(1, last - first)
+        else:
+            target = self.offset + first + int(amount)
+        self.scroll_to(target)
+
+    def chunk_offset(self, target):
+        """Offset of the chunk centered on target, so either direction can scroll on"""
+        return int(max(0, min(target - self.chunk_size // 2,
+                              len(self.password) - self.chunk_size)))
+
+    def recenter(self, target):
+        """Load the chunk centered on target; return False if it is already loaded"""
+        offset = self.chunk_offset(target)
+        if offset == self.offset:
+            return False
+        self.load_chunk(offset)
+        self.text.xview_moveto((target - offset) / max(1, len(self.chunk)))
+        return True
+
+    def scroll_to(self, target):
+        """Show the password from character index target, loading a chunk if needed"""
+        total = len(self.password)
+        target = int(max(0, min(target, total - 1)))
+        first, last = self.visible_range()
+        visible = max(1, last - first)
+
+        loaded_end = self.offset + len(self.chunk)
+        if self.offset <= target and (target + visible <= loaded_end or loaded_end >= total):
+            self.text.xview_moveto((target - self.offset) / max(1, len(self.chunk)))
+        else:
+            self.recenter(target)
+
+
+def after_first_paint(window, callback):
+    """Run callback once the window has really been drawn
+
+    An after_idle set up while building the window runs in the same idle
+    pass that maps it, before any widget is painted.  Instead, wait for the
+    first Expose, let that idle pass redraw the widgets, and only then run
+    the callback from a timer.
+    """
+    def on_expose(event):
+        window.unbind("<Expose>", binding)
+        window.after_idle(lambda: window.after(0, callback))
+    binding = window.bind("<Expose>", on_expose, add="+")
+
+
+class StartupProfile:
+    """Startup timeline printed with --profile-startup
+
+    The window scripts mark milestones (imports, Tk, fonts, widgets, first
+    paint, analysis loaded) relative to a perf_counter reading taken before
+    their own imports.  With --profile-startup on the command line, or
+    PASSWORD_CLARITY_PROFILE_STARTUP set, report() prints the timeline to
+    stderr against the time-to-interactive budget.  The slowest imports, as
+    measured by a fresh "python -X importtime" run, follow from a background
+    thread so the window stays responsive.  Interpreter start-up before the
+    first script line is not included in the timeline.
+    """
+
+    BUDGET_MS = 150
+
+    def __init__(self, begin):
+        self.begin = begin
+        self.marks = []
+        self.enabled = ("--profile-startup" in sys.argv
+                        or bool(os.environ.get("PASSWORD_CLARITY_PROFILE_STARTUP")))
+
+    def mark(self, name):
+        """Record that a milestone has been reached"""
+        self.marks.append((name, time.perf_counter()))
+
+    def report(self, out=sys.stderr):
+        """Print the timeline and import profile, once, if profiling is enabled"""
+        if not self.enabled or not self.marks:
+            return
+        self.enabled = False
+
+        out.write("Startup profile (ms since the first script line):\n")
+        previous = self.begin
+        for name, when in self.marks:
+            out.write(f"  {name:<18}{(when - self.begin) * 1000:8.1f}  (+{(when - previous) * 1000:.1f})\n")
+            previous = when
+        total = (previous - self.begin) * 1000
+        verdict = "within" if total <= self.BUDGET_MS else "OVER"
+        out.write(f"  time to interactive {total:.1f} ms, {verdict} the {self.BUDGET_MS} ms budget\n")
+
+        import threading
+        threading.Thread(target=lambda: out.write("".join(
+            line + "\n" for line in self.import_profile())), daemon=True).start()
+
+    def import_profile(self, limit=10):
+        """Return report lines for the slowest imports of the running script"""
+        script = os.path.abspath(sys.argv[0]) if sys.argv and sys.argv[0] else ""
+        if getattr(sys, "frozen", False) or not script.endswith(".py"):
+            return ["  (import profile is only available when running from source)"]
+
+        import subprocess
+        module = os.path.splitext(os.path.basename(script))[0]
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=os.path.dirname(script), capture_output=True, text=True)
+
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        imports = []
+        for line in result.stderr.splitlines():
+            fields = line.partition(":")[2].split("|")
+            if len(fields) == 3 and fields[0].strip().isdigit():
+                imports.append((int(fields[1]), int(fields[0]), fields[2].strip()))
+        imports.sort(reverse=True)
+
+        lines = [f"Slowest imports (python -X importtime, top {limit}):",
+                 "  cumulative ms   self ms  module"]
+        for cumulative, own, name in imports[:limit]:
+            lines.append(f"  {cumulative / 1000:13.1f} {own / 1000:9.1f}  {name}")
+        return lines
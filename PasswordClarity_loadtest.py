@@ -0,0 +1,459 @@
+import argparse
+import array
+import bisect
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import socketserver
+import string
+import subprocess
+import sys
+import threading
+import time
+
+from PasswordClarity_core import PasswordAnalyzer, make_passphrase
+
+
+def rss_bytes(pid="self"):
+    """Resident memory of a process in bytes, or None where it cannot be read"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if pid != "self":
+        return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current size; ru_maxrss is in KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def analyze(analyzer, password):
+    """The work one request does: the strength result and the full warning list"""
+    strength = analyzer.get_password_strength(password)
+    return {**strength, 'warnings': analyzer.check_common_patterns(password)}
+
+
+class AnalyzerHandler(socketserver.StreamRequestHandler):
+    """JSON lines: {"password": ...} -> strength and warnings, {"stats": true} -> memory"""
+
+    disable_nagle_algorithm = True  # Small request/response pairs; don't wait for delayed ACKs
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request.get("stats"):
+                    response = {'rss': rss_bytes()}
+                else:
+                    response = analyze(self.server.analyzer, request["password"])
+            except (ValueError, KeyError, TypeError) as error:
+                response = {'error': str(error)}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class AnalyzerServer(socketserver.ThreadingTCPServer):
+    """Local analysis service, one thread per connection, sharing one PasswordAnalyzer"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, analyzer):
+        super().__init__(address, AnalyzerHandler)
+        self.analyzer = analyzer
+
+
+class InProcessTarget:
+    """Calls the analyzer directly from the load-generating threads"""
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+
+    def call(self, password):
+        analyze(self.analyzer, password)
+
+    def memory(self):
+        return rss_bytes()
+
+    def close(self):
+        pass
+
+
+class SocketTarget:
+    """Sends each request to an AnalyzerServer, one connection per thread"""
+
+    def __init__(self, host, port):
+        self.address = (host, port)
+        self.local = threading.local()
+        self.connections = []
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            sock = socket.create_connection(self.address)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = self.local.conn = (sock, sock.makefile("rb"))
+            self.connections.append(conn)
+        return conn
+
+    def drop(self, conn):
+        """Close a connection that failed, so the next request opens a new one"""
+        self.local.conn = None
+        self.connections.remove(conn)
+        sock, reader = conn
+        reader.close()
+        sock.close()
+
+    def request(self, message):
+        conn = self.connection()
+        sock, reader = conn
+        try:
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            line = reader.readline()
+            if not line:
+                raise ConnectionError("service closed the connection")
+            response = json.loads(line)
+        except (OSError, ValueError):
+            self.drop(conn)
+            raise
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response
+
+    def call(self, password):
+        self.request({'password': password})
+
+    def memory(self):
+        return self.request({'stats': True})['rss']
+
+    def close(self):
+        for sock, reader in self.connections:
+            reader.close()
+            sock.close()
+
+
+def synthetic_passwords(analyzer, count, seed=None):
+    """A mix of what users type: passphrases, common passwords, word+digits and random strings"""
+    rng = random.Random(seed)
+    common = sorted(analyzer.common_passwords)
+    alphabet = string.ascii_letters + string.digits + string.punctuation
+    passwords = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            passwords.append(make_passphrase(rng, analyzer.word_list, analyzer.symbol_list))
+        elif kind < 0.65:
+            passwords.append(rng.choice(common))
+        elif kind < 0.8:
+            passwords.append(rng.choice(analyzer.word_list).capitalize() + str(rng.randint(0, 9999)))
+        else:
+            passwords.append("".join(rng.choice(alphabet) for _ in range(rng.randint(8, 24))))
+    return passwords
+
+
+def recorded_passwords(path, count, seed=None):
+    """Sample count passwords from a recorded file, keeping its distribution"""
+    with open(path, encoding="utf-8", errors="surrogateescape") as f:
+        recorded = [line.rstrip("\r\n") for line in f if line.strip("\r\n")]
+    if not recorded:
+        sys.exit(f"{path} has no passwords")
+    rng = random.Random(seed)
+    return [rng.choice(recorded) for _ in range(count)]
+
+
+# Latencies are counted in log-spaced buckets from 1 us to 1000 s, 100 per
+# decade (each about 2.3% wide), so a run's memory does not grow with its
+# length and the service's memory growth is not distorted by the client
+HISTOGRAM_MIN = 1e-6
+BUCKETS_PER_DECADE = 100
+BUCKETS = 9 * BUCKETS_PER_DECADE + 1
+
+
+class LatencyHistogram:
+    """Fixed-size histogram of latencies in seconds"""
+
+    def __init__(self):
+        self.counts = array.array("Q", bytes(8 * BUCKETS))
+        self.max = 0.0
+
+    def add(self, seconds):
+        if seconds > self.max:
+            self.max = seconds
+        if seconds <= HISTOGRAM_MIN:
+            index = 0
+        else:
+            index = min(BUCKETS - 1, math.ceil(math.log10(seconds / HISTOGRAM_MIN)
+                                               * BUCKETS_PER_DECADE))
+        self.counts[index] += 1
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.max = max(self.max, other.max)
+
+    def total(self):
+        return sum(self.counts)
+
+    def percentile(self, fraction):
+        """Nearest-rank percentile, reported as the upper edge of its bucket"""
+        total = self.total()
+        if not total:
+            return 0.0
+        rank = min(total, max(1, round(fraction * total)))
+        index = bisect.bisect_left(list(itertools.accumulate(self.counts)), rank)
+        return min(self.max, HISTOGRAM_MIN * 10 ** (index / BUCKETS_PER_DECADE))
+
+
+def sample_memory(target):
+    """Resident memory of the target, or None when this sample cannot be taken"""
+    try:
+        return target.memory()
+    except (OSError, RuntimeError, ValueError):
+        return None
+
+
+def run_load(target, passwords, concurrency=4, rate=0.0, duration=10.0, requests=0,
+             sample_interval=1.0):
+    """Drive target from concurrency threads and return the measurements
+
+    With a rate, each thread sends on a fixed schedule (open loop) and
+    latency is measured from the scheduled send time, so a slow service
+    shows up as queueing delay instead of silently lowering the load.
+    Without one, each thread sends its next request as soon as the previous
+    answer arrives.  The run stops after duration seconds or, when given,
+    after requests requests.
+    """
+    issued = itertools.count()
+    latencies = [LatencyHistogram() for _ in range(concurrency)]
+    errors = [0] * concurrency
+    interval = concurrency / rate if rate else 0.0
+    start = time.perf_counter()
+    deadline = start + duration if duration else float("inf")
+
+    def worker(index):
+        own = latencies[index]
+        for sent in itertools.count():
+            if requests and next(issued) >= requests:
+                return
+            now = time.perf_counter()
+            if interval:
+                scheduled = start + (sent + index / concurrency) * interval
+                if scheduled >= deadline:
+                    return
+                if scheduled > now:
+                    time.sleep(scheduled - now)
+            elif now >= deadline:
+                return
+            else:
+                scheduled = now
+            try:
+                target.call(passwords[(sent * concurrency + index) % len(passwords)])
+            except (OSError, RuntimeError, ValueError):
+                errors[index] += 1
+                continue
+            own.add(time.perf_counter() - scheduled)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    memory = [(0.0, sample_memory(target))]
+    for thread in threads:
+        thread.start()
+    next_sample = start + sample_interval
+    while any(thread.is_alive() for thread in threads):
+        time.sleep(max(0.0, min(0.05, next_sample - time.perf_counter())))
+        if time.perf_counter() >= next_sample:
+            memory.append((time.perf_counter() - start, sample_memory(target)))
+            next_sample += sample_interval
+    elapsed = time.perf_counter() - start
+    memory.append((elapsed, sample_memory(target)))
+
+    histogram = LatencyHistogram()
+    for own in latencies:
+        histogram.merge(own)
+    completed = histogram.total()
+    return {
+        'requests': completed,
+        'errors': sum(errors),
+        'elapsed': elapsed,
+        'throughput': completed / elapsed if elapsed else 0.0,
+        'p50_ms': histogram.percentile(0.50) * 1000,
+        'p95_ms': histogram.percentile(0.95) * 1000,
+        'p99_ms': histogram.percentile(0.99) * 1000,
+        'max_ms': histogram.max * 1000,
+        'memory': memory,
+    }
+
+
+def memory_growth_mb(results):
+    """Growth in resident memory over the run, or None if it was not measured"""
+    samples = [rss for _, rss in results['memory'] if rss is not None]
+    if len(samples) < 2:
+        return None
+    return (samples[-1] - samples[0]) / (1024 * 1024)
+
+
+def check_slos(results, args):
+    """Return (description, measured, passed) for each configured SLO"""
+    checks = []
+    for name, limit in (("p50_ms", args.slo_p50_ms), ("p95_ms", args.slo_p95_ms),
+                        ("p99_ms", args.slo_p99_ms)):
+        if limit is not None:
+            checks.append((f"{name[:3]} <= {limit} ms", results[name], results[name] <= limit))
+    if args.slo_min_rps is not None:
+        checks.append((f"throughput >= {args.slo_min_rps} req/s", results['throughput'],
+                       results['throughput'] >= args.slo_min_rps))
+    if args.slo_max_errors is not None:
+        checks.append((f"errors <= {args.slo_max_errors}", results['errors'],
+                       results['errors'] <= args.slo_max_errors))
+    if args.slo_max_growth_mb is not None:
+        growth = memory_growth_mb(results)
+        checks.append((f"memory growth <= {args.slo_max_growth_mb} MB", growth,
+                       growth is not None and growth <= args.slo_max_growth_mb))
+    return checks
+
+
+def write_report(results, checks, out=sys.stdout):
+    """Print the measurements, the memory timeline and the SLO verdicts"""
+    out.write(f"requests     {results['requests']} ({results['errors']} errors) "
+              f"in {results['elapsed']:.1f} s\n")
+    out.write(f"throughput   {results['throughput']:.1f} req/s\n")
+    out.write(f"latency ms   p50 {results['p50_ms']:.3f}  p95 {results['p95_ms']:.3f}  "
+              f"p99 {results['p99_ms']:.3f}  max {results['max_ms']:.3f}\n")
+    growth = memory_growth_mb(results)
+    if growth is None:
+        out.write("memory       not available\n")
+    else:
+        out.write(f"memory       growth {growth:+.1f} MB\n")
+        for when, rss in results['memory']:
+            if rss is not None:
+                out.write(f"  {when:7.1f} s  {rss / (1024 * 1024):8.1f} MB\n")
+    for description, measured, passed in checks:
+        shown = "n/a" if measured is None else f"{measured:.3f}".rstrip("0").rstrip(".")
+        out.write(f"SLO {description}: {'PASS' if passed else 'FAIL'} ({shown})\n")
+
+
+def start_server_process():
+    """Start "serve" in a child process and return (process, port)"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "serve", "--port", "0"],
+        stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("listening on "):
+        process.kill()
+        sys.exit("could not start the analysis service")
+    return process, int(line.rsplit(":", 1)[1])
+
+
+def run_serve(args):
+    """Serve the analyzer on a local socket until interrupted"""
+    server = AnalyzerServer((args.host, args.port), PasswordAnalyzer())
+    host, port = server.server_address[:2]
+    print(f"listening on {host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def run_loadtest(args):
+    """Generate load, print the report and fail when an SLO is missed"""
+    analyzer = PasswordAnalyzer()
+    if args.replay:
+        passwords = recorded_passwords(args.replay, args.pool_size, args.seed)
+    else:
+        passwords = synthetic_passwords(analyzer, args.pool_size, args.seed)
+
+    server = None
+    if args.mode == "inprocess":
+        target = InProcessTarget(analyzer)
+    elif args.address:
+        host, _, port = args.address.rpartition(":")
+        target = SocketTarget(host or "127.0.0.1", int(port))
+        try:
+            target.connection()
+        except OSError as error:
+            sys.exit(f"cannot connect to {args.address}: {error}")
+    else:
+        server, port = start_server_process()
+        target = SocketTarget("127.0.0.1", port)
+
+    try:
+        results = run_load(target, passwords, args.concurrency, args.rate, args.duration,
+                           args.requests, args.sample_interval)
+    finally:
+        target.close()
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    checks = check_slos(results, args)
+    if args.json:
+        summary = dict(results)
+        summary['memory'] = [{'seconds': when, 'rss': rss} for when, rss in results['memory']]
+        summary['memory_growth_mb'] = memory_growth_mb(results)
+        summary['slos'] = [{'slo': d, 'measured': m, 'passed': p} for d, m, p in checks]
+        json.dump(summary, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        write_report(results, checks)
+    return 0 if all(passed for _, _, passed in checks) else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="PasswordClarity_loadtest",
+        description="Load-test the password analyzer in-process or over a local socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="generate load and report latency, throughput and memory")
+    run.add_argument("--mode", choices=["inprocess", "socket"], default="inprocess",
+                     help="call the analyzer directly or through the socket service (default: inprocess)")
+    run.add_argument("--address", default=None,
+                     help="HOST:PORT of a running service (socket mode; default: start one)")
+    run.add_argument("--concurrency", type=int, default=4, help="client threads (default: 4)")
+    run.add_argument("--rate", type=float, default=0.0,
+                     help="total requests per second (default: as fast as possible)")
+    run.add_argument("--duration", type=float, default=10.0, help="seconds to run (default: 10)")
+    run.add_argument("--requests", type=int, default=0, help="stop after this many requests")
+    run.add_argument("--replay", default=None,
+                     help="file of recorded passwords, one per line (default: synthetic mix)")
+    run.add_argument("--pool-size", type=int, default=10000,
+                     help="distinct requests prepared before the run (default: 10000)")
+    run.add_argument("--seed", type=int, default=None, help="seed for the request mix")
+    run.add_argument("--sample-interval", type=float, default=1.0,
+                     help="seconds between memory samples (default: 1)")
+    run.add_argument("--json", action="store_true", help="print the results as JSON")
+    run.add_argument("--slo-p50-ms", type=float, default=None,
+                     help="fail if the median latency exceeds this many milliseconds")
+    run.add_argument("--slo-p95-ms", type=float, default=None,
+                     help="fail if the 95th percentile latency exceeds this many milliseconds")
+    run.add_argument("--slo-p99-ms", type=float, default=None,
+                     help="fail if the 99th percentile latency exceeds this many milliseconds")
+    run.add_argument("--slo-min-rps", type=float, default=None,
+                     help="fail if throughput is below this many requests per second")
+    run.add_argument("--slo-max-errors", type=int, default=None,
+                     help="fail if more than this many requests fail")
+    run.add_argument("--slo-max-growth-mb", type=float, default=None,
+                     help="fail if resident memory grows by more than this many MB over the run")
+    run.set_defaults(func=run_loadtest)
+
+    serve = commands.add_parser("serve", help="serve the analyzer as JSON lines on a local socket")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="port (default: 8765, 0 for any)")
+    serve.set_defaults(func=run_serve)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
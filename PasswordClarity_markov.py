@@ -0,0 +1,297 @@
+import argparse
+import array
+import bisect
+import collections
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+
+MAGIC = b"PCMK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")  # magic, version, alphabet size, number of samples
+
+# Symbols: 0 marks the start/end of a password, 1-95 are printable ASCII and
+# 96 is any other byte (control characters and UTF-8 sequences)
+ALPHABET = 97
+END = 0
+OTHER = ALPHABET - 1
+SYMBOL_TABLE = bytes(byte - 0x1F if 0x20 <= byte <= 0x7E else OTHER for byte in range(256))
+TABLE_SIZE = ALPHABET ** 3  # Two symbols of context times the next symbol
+
+COST_SCALE = 8  # Costs are -log2(probability) in eighths of a bit, one byte per cell
+MAX_COST = 255
+MAX_SAMPLE_LENGTH = 64
+
+
+def password_symbols(password):
+    """Map a password (str or bytes) to model symbols, one per UTF-8 byte"""
+    if isinstance(password, str):
+        # Undecodable bytes kept by surrogateescape map back to the bytes the model was trained on
+        try:
+            password = password.encode("utf-8", "surrogateescape")
+        except UnicodeEncodeError:
+            password = password.encode("utf-8", "surrogatepass")
+    return password.translate(SYMBOL_TABLE)
+
+
+def count_corpus(paths, counts, with_counts=False, batch_lines=65536, log=sys.stderr):
+    """Add the trigram counts of every password in the corpus files to counts
+
+    Files are read line by line and counted in batches, so memory stays
+    bounded by the fixed-size count table whatever the corpus size.  Plain
+    corpora hold one password per line (repeats included); with_counts
+    reads "COUNT PASSWORD" lines as produced by uniq -c.
+    """
+    for path in paths:
+        log.write(f"reading {path}\n")
+        with open(path, "rb") as f:
+            if with_counts:
+                for line in f:
+                    count, _, password = line.strip(b"\r\n").lstrip().partition(b" ")
+                    if password and count.isdigit():
+                        add_password(counts, password.translate(SYMBOL_TABLE), int(count))
+                continue
+
+            batch = []
+            for line in f:
+                symbols = line.rstrip(b"\r\n").translate(SYMBOL_TABLE)
+                if symbols:
+                    batch.append(symbols)
+                if len(batch) >= batch_lines:
+                    add_batch(counts, batch)
+                    batch = []
+            add_batch(counts, batch)
+
+
+def add_password(counts, symbols, weight=1):
+    """Count the trigrams of one password, padded with start and end symbols"""
+    padded = b"\0\0" + symbols + b"\0"
+    for i in range(len(padded) - 2):
+        counts[(padded[i] * ALPHABET + padded[i + 1]) * ALPHABET + padded[i + 2]] += weight
+
+
+def add_batch(counts, batch):
+    """Count the trigrams of many passwords at once
+
+    The passwords are joined into one buffer with the padding in between and
+    counted with a single Counter over its trigrams.  Joining adds two
+    trigrams per boundary that are not in any password, (x, END, END) and
+    (END, END, END); train() discards those rows and that cell.
+    """
+    if not batch:
+        return
+    buffer = b"\0\0" + b"\0\0\0".join(batch) + b"\0"
+    for (a, b, c), n in collections.Counter(zip(buffer, buffer[1:], buffer[2:])).items():
+        counts[(a * ALPHABET + b) * ALPHABET + c] += n
+
+
+def quantize(counts, alpha=0.01):
+    """Turn trigram counts into a table of per-symbol costs, one byte each"""
+    table = bytearray(TABLE_SIZE)
+    uniform = min(MAX_COST, round(math.log2(ALPHABET) * COST_SCALE))
+    for context in range(ALPHABET * ALPHABET):
+        start = context * ALPHABET
+        row = counts[start:start + ALPHABET]
+        if context % ALPHABET == END and context != END:
+            row = [0] * ALPHABET  # Only seen across joined passwords, never scored
+        if context == END:
+            row[END] = 0  # Empty passwords are not scored
+        total = sum(row)
+        if not total:
+            table[start:start + ALPHABET] = bytes([uniform]) * ALPHABET
+            continue
+        denominator = total + alpha * ALPHABET
+        for symbol, count in enumerate(row):
+            cost = -math.log2((count + alpha) / denominator) * COST_SCALE
+            table[start + symbol] = min(MAX_COST, round(cost))
+    return table
+
+
+def sample_costs(table, samples, seed=None):
+    """Costs of passwords sampled from the model, for Monte Carlo ranking"""
+    rng = random.Random(seed)
+    cumulative = {}  # Context -> cumulative weights, built on first use
+    costs = []
+    for _ in range(samples):
+        context, cost = END, 0
+        for _ in range(MAX_SAMPLE_LENGTH):
+            weights = cumulative.get(context)
+            if weights is None:
+                start = context * ALPHABET
+                weights = [0.0] * ALPHABET
+                total = 0.0
+                for symbol in range(ALPHABET):
+                    if not (context == END and symbol == END):
+                        total += 2.0 ** (-table[start + symbol] / COST_SCALE)
+                    weights[symbol] = total
+                cumulative[context] = weights
+            symbol = bisect.bisect_right(weights, rng.random() * weights[-1])
+            symbol = min(symbol, ALPHABET - 1)
+            cost += table[context * ALPHABET + symbol]
+            if symbol == END:
+                break
+            context = (context % ALPHABET) * ALPHABET + symbol
+        else:
+            cost += table[context * ALPHABET + END]
+        costs.append(cost)
+    return costs
+
+
+def rank_table(costs):
+    """Sorted sample costs and the guess number reached at each of them
+
+    Monte Carlo estimation: a password is guessed after every password the
+    model finds more probable, and each sample with probability p stands
+    for 1 / (n * p) of them.
+    """
+    costs = sorted(costs)
+    ranks = array.array("d")
+    rank = 0.0
+    for cost in costs:
+        rank += 2.0 ** (cost / COST_SCALE) / len(costs)
+        ranks.append(rank)
+    return array.array("I", costs), ranks
+
+
+def train(model_path, corpora, with_counts=False, samples=20000, seed=None, log=sys.stderr):
+    """Train a model from corpus files and write it to model_path"""
+    counts = array.array("Q", bytes(8 * TABLE_SIZE))
+    count_corpus(corpora, counts, with_counts, log=log)
+    table = quantize(counts)
+    log.write(f"sampling {samples} passwords for the rank table\n")
+    costs, ranks = rank_table(sample_costs(table, samples, seed))
+    if sys.byteorder != "little":
+        costs.byteswap()
+        ranks.byteswap()
+
+    with open(model_path + ".tmp", "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, ALPHABET, len(costs)))
+        f.write(table)
+        f.write(bytes(-f.tell() % 8))
+        f.write(costs.tobytes())
+        f.write(bytes(-f.tell() % 8))
+        f.write(ranks.tobytes())
+    os.replace(model_path + ".tmp", model_path)
+
+
+class MarkovModel:
+    """Character trigram model that estimates how many guesses a password takes
+
+    The model file holds a table of quantized -log2 probabilities, one byte
+    per (two-symbol context, next symbol), and the costs of passwords
+    sampled from the model with the guess number each one corresponds to.
+    Scoring a password adds one table cell per byte and finds its guess
+    number with a binary search, so a check takes microseconds.  The file
+    is memory-mapped read-only, so every process using it shares one copy
+    in the page cache.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, alphabet, samples = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION or alphabet != ALPHABET:
+            raise ValueError(f"{path} is not a Password Clarity model")
+
+        view = memoryview(self.map)
+        offset = HEADER.size
+        self.table = view[offset:offset + TABLE_SIZE]
+        offset += TABLE_SIZE
+        offset += -offset % 8
+        self.costs = view[offset:offset + 4 * samples].cast("I")
+        offset += 4 * samples
+        offset += -offset % 8
+        self.ranks = view[offset:offset + 8 * samples].cast("d")
+        if sys.byteorder != "little":
+            self.costs = array.array("I", self.costs)
+            self.costs.byteswap()
+            self.ranks = array.array("d", self.ranks)
+            self.ranks.byteswap()
+
+    def step(self, context, text):
+        """Return (cost, context) after appending text (str or bytes) to context"""
+        table = self.table
+        cost = 0
+        for symbol in password_symbols(text):
+            cost += table[context * ALPHABET + symbol]
+            context = (context % ALPHABET) * ALPHABET + symbol
+        return cost, context
+
+    def end_cost(self, context):
+        """Cost of ending the password after context"""
+        return self.table[context * ALPHABET + END]
+
+    def cost(self, password):
+        """Quantized -log2 probability of the whole password (str or bytes)"""
+        cost, context = self.step(END, password)
+        return cost + self.end_cost(context)
+
+    def guesses_for_cost(self, cost):
+        """Estimated guess number of a password with the given cost"""
+        index = bisect.bisect_left(self.costs, cost)
+        if index == len(self.costs):
+            # Less probable than every sample: 1/p is the usual lower estimate
+            return max(self.ranks[-1], 2.0 ** (cost / COST_SCALE))
+        return max(1.0, self.ranks[index - 1] if index else 1.0)
+
+    def guesses(self, password):
+        """Estimated number of guesses a model-based cracker needs for password"""
+        return self.guesses_for_cost(self.cost(password))
+
+
+_models = {}
+
+
+def open_strength_model(path=None):
+    """Open the model at path or $PASSWORD_CLARITY_MODEL, or return None
+
+    Models are opened once per process and shared by every analyzer.
+    """
+    path = path or os.environ.get("PASSWORD_CLARITY_MODEL")
+    if not path or not os.path.isfile(path):
+        return None
+    path = os.path.abspath(path)
+    if path not in _models:
+        _models[path] = MarkovModel(path)
+    return _models[path]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="PasswordClarity_markov",
+        description="Train and query a Markov model that estimates password guess numbers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    train_command = commands.add_parser("train", help="train a model from password corpora")
+    train_command.add_argument("model", help="model file to write")
+    train_command.add_argument("corpora", nargs="+", help="corpus files, one password per line")
+    train_command.add_argument("--with-counts", action="store_true",
+                               help='corpus lines are "COUNT PASSWORD", as produced by uniq -c')
+    train_command.add_argument("--samples", type=int, default=20000,
+                               help="passwords sampled for the rank table (default: 20000)")
+    train_command.add_argument("--seed", type=int, default=None, help="seed for sampling")
+
+    guesses_command = commands.add_parser(
+        "guesses", help="estimate guess numbers for passwords read from stdin")
+    guesses_command.add_argument("model", help="model file")
+
+    args = parser.parse_args(argv)
+    if args.command == "train":
+        train(args.model, args.corpora, args.with_counts, args.samples, args.seed)
+        return 0
+
+    model = open_strength_model(args.model)
+    if model is None:
+        parser.error(f"{args.model} does not exist")
+    for line in sys.stdin:
+        password = line.rstrip("\r\n")
+        if password:
+            print(f"{model.guesses(password):.3g}\t{password}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
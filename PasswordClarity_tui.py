@@ -0,0 +1,232 @@
+import curses
+import itertools
+import sys
+
+from PasswordClarity_core import LINE_BREAK, IncrementalAnalyzer, PasswordAnalyzer, classify_char
+
+# Bracketed paste: the terminal wraps pasted text in these markers once enabled
+BRACKETED_PASTE_ON, BRACKETED_PASTE_OFF = "\x1b[?2004h", "\x1b[?2004l"
+PASTE_START, PASTE_END = "\x1b[200~", "\x1b[201~"
+
+
+class TerminalVisualizer:
+    """Terminal version of PasswordVisualizer for hosts without a display
+
+    Same layout as the Tk window: input line, colour-coded characters,
+    warnings, counts and strength bar.  Tkinter is never imported.  Each
+    batch of keystrokes (a paste arrives as one batch) is analyzed once,
+    incrementally when it only appends, and only the rows whose content
+    changed are rewritten, which keeps the traffic small over slow SSH links.
+    Pastes are recognized by bracketed-paste markers, so line breaks inside
+    them are kept while a typed-ahead Enter still submits.
+    """
+
+    # Screen rows for each part of the layout
+    TITLE_ROW, INPUT_ROW, DISPLAY_ROW, WARNING_ROW, COUNTS_ROW, STRENGTH_ROW, HELP_ROW = (
+        0, 1, 3, 5, 7, 8, 10)
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.analyzer = IncrementalAnalyzer(PasswordAnalyzer())
+        self.password = ""
+        self.result = None
+        self.rows = {}  # Last content drawn on each row, to skip unchanged rows
+        self.max_warnings = 3
+        self.escape = ""  # Escape sequence read so far
+        self.pasting = False  # Between PASTE_START and PASTE_END
+        self.previous_key = None
+
+        curses.curs_set(1)
+        curses.nonl()  # Keep "\r" and "\n" apart so pasted CRLF line endings can be collapsed
+        self.screen.keypad(True)
+        self.init_colors()
+
+    def init_colors(self):
+        """Map the Password Clarity palette onto the basic terminal colours"""
+        self.attrs = dict.fromkeys(
+            ("uppercase", "lowercase", "digit", "symbol", "confusable",
+             "weak", "moderate", "strong"), curses.A_NORMAL)
+        if not curses.has_colors():
+            self.attrs["confusable"] = curses.A_REVERSE
+            return
+
+        curses.start_color()
+        try:
+            curses.use_default_colors()
+            background = -1
+        except curses.error:
+            background = curses.COLOR_BLACK
+
+        pairs = {
+            "uppercase": (curses.COLOR_GREEN, background),
+            "lowercase": (curses.COLOR_BLUE, background),
+            "digit": (curses.COLOR_RED, background),
+            "confusable": (curses.COLOR_BLACK, curses.COLOR_YELLOW),
+            "weak": (curses.COLOR_RED, background),
+            "moderate": (curses.COLOR_YELLOW, background),
+            "strong": (curses.COLOR_GREEN, background),
+        }
+        for number, (name, (foreground, back)) in enumerate(pairs.items(), 1):
+            curses.init_pair(number, foreground, back)
+            self.attrs[name] = curses.color_pair(number) | curses.A_BOLD
+
+    def draw_row(self, row, segments):
+        """Draw a row from (text, attr) segments unless it is already on screen"""
+        height, width = self.screen.getmaxyx()
+        if row >= height or self.rows.get(row) == segments:
+            return
+        self.rows[row] = segments
+
+        self.screen.move(row, 0)
+        self.screen.clrtoeol()
+        column = 0
+        for text, attr in segments:
+            text = text[:max(0, width - 1 - column)]
+            if not text:
+                break
+            self.screen.addstr(row, column, text, attr)
+            column += len(text)
+
+    def tail(self, text, width):
+        """Keep the end of text visible when it is wider than the screen"""
+        text = text.replace("\n", LINE_BREAK)
+        if len(text) <= width:
+            return 0, text
+        return len(text) - width + 1, "…" + text[-(width - 1):]
+
+    def refresh(self):
+        """Re-analyze the password and redraw the rows that changed"""
+        width = self.screen.getmaxyx()[1] - 1
+        password = self.password
+        strength = self.analyzer.get_password_strength(password)
+
+        self.draw_row(self.TITLE_ROW, (("Enter password to clarify:", curses.A_BOLD),))
+        input_start, input_text = self.tail(password, width - 2)
+        self.draw_row(self.INPUT_ROW, (("> " + input_text, curses.A_NORMAL),))
+
+        # Colour-coded characters, coalesced into runs of the same attribute
+        start, _ = self.tail(password, width)
+        segments = [("…", curses.A_DIM)] if start else []
+        visible = password[start:]
+        for (tag, lookalike), chars in itertools.groupby(visible, key=classify_char):
+            attr = self.attrs["confusable"] if lookalike is not None else self.attrs[tag]
+            segments.append(("".join(chars).replace("\n", LINE_BREAK), attr))
+        self.draw_row(self.DISPLAY_ROW, tuple(segments))
+
+        warnings = list(itertools.islice(
+            self.analyzer.iter_warnings(password), self.max_warnings + 1))
+        warning_text = " | ".join(warnings[:self.max_warnings])
+        if len(warnings) > self.max_warnings:
+            warning_text += " | more issues"
+        self.draw_row(self.WARNING_ROW, ((warning_text, self.attrs["weak"]),))
+
+        self.draw_row(self.COUNTS_ROW, (
+            (f"Capital: {strength['capitals']}   ", self.attrs["uppercase"]),
+            (f"Lower: {strength['lowers']}   ", self.attrs["lowercase"]),
+            (f"Number: {strength['numbers']}   ", self.attrs["digit"]),
+            (f"Symbol: {strength['symbols']}", self.attrs["symbol"]),
+        ))
+
+        score = strength['score']
+        level = "weak" if score < 30 else "moderate" if score < 80 else "strong"
+        filled = score // 5
+        self.draw_row(self.STRENGTH_ROW, (
+            ("[" + "#" * filled + "-" * (20 - filled) + "] ", self.attrs[level]),
+            (f"Strength: {score}/100", self.attrs[level]),
+        ))
+
+        self.draw_row(self.HELP_ROW, (
+            ("Enter: OK   Esc: cancel   Ctrl-U: clear", curses.A_DIM),))
+
+        if self.INPUT_ROW < self.screen.getmaxyx()[0]:
+            self.screen.move(self.INPUT_ROW, min(width, 2 + len(password) - input_start))
+        self.screen.refresh()
+
+    def handle_key(self, key, pasted=False):
+        """Apply one key; return False when the window should close"""
+        if key in ("\n", "\r", curses.KEY_ENTER):
+            if pasted:
+                # A line break inside a paste (PEM blocks, multi-line keys) is part of the secret
+                self.password += "\n"
+                return True
+            self.result = self.password
+            return False
+        if key == "\x1b":
+            return False
+        if key in ("\x7f", "\b", curses.KEY_BACKSPACE):
+            self.password = self.password[:-1]
+        elif key == "\x15":  # Ctrl-U
+            self.password = ""
+        elif key == curses.KEY_RESIZE:
+            self.rows = {}
+            self.screen.clear()
+        elif isinstance(key, str) and key.isprintable():
+            self.password += key
+        return True
+
+    def run(self):
+        """Read keys until Enter or Esc, redrawing once per batch of input"""
+        sys.stdout.write(BRACKETED_PASTE_ON)
+        sys.stdout.flush()
+        try:
+            return self.read_keys()
+        finally:
+            sys.stdout.write(BRACKETED_PASTE_OFF)
+            sys.stdout.flush()
+
+    def read_keys(self):
+        """Main loop of run()"""
+        self.refresh()
+        while True:
+            keys = [self.screen.get_wch()]
+            # Drain whatever else has already arrived (pastes, fast typing)
+            self.screen.nodelay(True)
+            try:
+                while True:
+                    keys.append(self.screen.get_wch())
+            except curses.error:
+                pass
+            finally:
+                self.screen.nodelay(False)
+
+            if not self.handle_batch(keys):
+                return self.result
+            self.refresh()
+
+    def handle_batch(self, keys):
+        """Apply keys that arrived together, splitting out bracketed-paste markers"""
+        for index, key in enumerate(keys):
+            if self.escape:
+                if isinstance(key, str):
+                    self.escape += key
+                    if self.escape in (PASTE_START, PASTE_END):
+                        self.pasting = self.escape == PASTE_START
+                        self.escape = ""
+                    elif not (PASTE_START.startswith(self.escape)
+                              or PASTE_END.startswith(self.escape)):
+                        self.escape = ""  # Some other sequence (Alt+key, function key): ignore it
+                    continue
+                self.escape = ""
+            elif key == "\x1b" and index + 1 < len(keys):
+                self.escape = key  # Esc followed by more input starts a sequence
+                continue
+
+            previous, self.previous_key = self.previous_key, key
+            if self.pasting and key == "\n" and previous == "\r":
+                continue  # CRLF line ending: keep a single line break
+            if not self.handle_key(key, self.pasting):
+                return False
+        return True
+
+def show_password_terminal():
+    """Show the terminal visualizer and return the result"""
+    curses.set_escdelay(25)
+    return curses.wrapper(lambda screen: TerminalVisualizer(screen).run())
+
+
+if __name__ == "__main__":
+    password = show_password_terminal()
+    if password:
+        print(f"Password entered: {password}")
+    else:
+        print("No password entered or window closed.")
@@ -1,15 +1,21 @@
+import time
+STARTUP_BEGIN = time.perf_counter()  # Reference point for --profile-startup
+
 import tkinter as tk
 from tkinter import font as tkfont
-from tkinter import messagebox
-import re
-import math
-import random
-import hashlib
+import itertools
+
+from PasswordClarity_core import COLORS, IncrementalAnalyzer, PasswordAnalyzer, make_passphrase
+from PasswordClarity_display import StartupProfile, VirtualizedDisplay, after_first_paint
+
+STARTUP = StartupProfile(STARTUP_BEGIN)
+STARTUP.mark("imports")
 
 
 class PasswordVisualizer:
     def __init__(self, master):
         self.master = master
+        self.analyzer = None  # Built after the window is drawn, see load_analysis
         master.title("Password Clarity")
         master.geometry("800x500")
         master.resizable(True, False)  # Allow horizontal resizing
@@ -21,19 +27,10 @@ class PasswordVisualizer:
         self.stats_font = tkfont.Font(family="DejaVu Sans", size=12)
         self.count_font = tkfont.Font(family="DejaVu Sans", size=12, weight="bold")
         self.small_font = tkfont.Font(family="DejaVu Sans", size=10)
+        STARTUP.mark("fonts")
 
-        # Colors for character types
-        self.colors = {
-            'capital': "#00AA00",  # Green
-            'lower': "#0000AA",  # Blue
-            'number': "#AA0000",  # Red
-            'symbol': "#000000"  # Black
-        }
-
-        # Load word lists and common passwords
-        self.word_list = self.load_word_list()
-        self.symbol_list = ['@', '#', '$', '%', '&', '*', '!', '?', '>', '<', '+']
-        self.common_passwords = self.load_common_passwords()
+        # Colors for character types (shared with the headless reports)
+        self.colors = dict(COLORS)
 
         # Create frames for layout
         self.main_frame = tk.Frame(master, padx=20, pady=20)
@@ -90,6 +87,10 @@ class PasswordVisualizer:
         self.password_text.tag_configure("lowercase", foreground=self.colors['lower'])
         self.password_text.tag_configure("digit", foreground=self.colors['number'])
         self.password_text.tag_configure("symbol", foreground=self.colors['symbol'])
+        self.password_text.tag_configure("confusable", background=self.colors['confusable'])
+
+        # Long pastes are loaded in chunks and tagged only where visible
+        self.display = VirtualizedDisplay(self.password_text, self.h_scrollbar)
 
         # Security warnings frame
         self.warning_frame = tk.Frame(self.main_frame)
@@ -104,6 +105,11 @@ class PasswordVisualizer:
             justify=tk.LEFT
         )
         self.warning_label.pack(anchor=tk.W)
+        self.warning_label.bind("<Button-1>", self.toggle_warnings)
+
+        # Only the first few warnings are computed unless the list is expanded
+        self.max_warnings = 3
+        self.warnings_expanded = False
 
         # Strength and counts frame
         self.stats_frame = tk.Frame(self.main_frame)
@@ -250,277 +256,39 @@ class PasswordVisualizer:
         # Result variable
         self.result = None
         self.current_suggestion = ""
+        STARTUP.mark("widgets")
+
+        # Load the analysis data once the window is on screen
+        after_first_paint(master, self.load_analysis)
 
-    def load_word_list(self):
-        """Load a comprehensive word list"""
-        # This is a sample word list - you can replace with your Excel word list
-        words = [
-            "abandon", "ability", "absence", "academy", "account", "accused", "achieve", "acquire", "address",
-            "advance",
-            "advocate", "african", "against", "already", "ancient", "another", "anxiety", "anybody", "application",
-            "approach",
-            "arrange", "article", "attempt", "attract", "auction", "average", "balance", "battery", "beneath",
-            "benefit",
-            "between", "bicycle", "brother", "brought", "builder", "burning", "cabinet", "caliber", "calcium",
-            "campaign",
-            "capable", "capacity", "capital", "captain", "capture", "careful", "carrier", "catalog", "ceiling",
-            "central",
-            "century", "certain", "chamber", "channel", "chapter", "charity", "chemical", "chicken", "circuit",
-            "citizen",
-            "classic", "climate", "clothes", "college", "combine", "comfort", "command", "comment", "company",
-            "compare",
-            "compile", "complex", "compute", "concept", "concern", "confirm", "connect", "consent", "consist",
-            "contact",
-            "contain", "content", "contest", "context", "control", "convert", "council", "counter", "country",
-            "courage",
-            "crystal", "culture", "current", "custody", "dealing", "decline", "default", "defense", "deliver",
-            "density",
-            "deposit", "desktop", "despite", "destroy", "diagram", "digital", "dignity", "diploma", "disable",
-            "disease",
-            "dismiss", "display", "dispute", "divorce", "domestic", "drawing", "dynamic", "eastern", "economy",
-            "element",
-            "enhance", "evening", "exclude", "execute", "exhibit", "explain", "explore", "extreme", "factory",
-            "failure",
-            "fantasy", "fashion", "feature", "federal", "finance", "finding", "fishing", "fitness", "foreign",
-            "formula",
-            "fortune", "forward", "freedom", "freight", "funeral", "gallery", "gateway", "general", "genetic",
-            "genuine",
-            "glimpse", "grocery", "growing", "habitat", "harmony", "heading", "hearing", "heating", "holiday",
-            "horizon",
-            "husband", "illegal", "imagery", "imagine", "immune", "impact", "improve", "initial", "inquiry", "insight",
-            "install", "instead", "intense", "interim", "involve", "journal", "journey", "justice", "justify",
-            "kitchen",
-            "landing", "largely", "leading", "learning", "leaving", "lecture", "leisure", "license", "limited",
-            "listing",
-            "logical", "loyalty", "machine", "manager", "mandate", "martial", "maximum", "meaning", "measure",
-            "medical",
-            "meeting", "mental", "message", "mineral", "minimal", "minimum", "mission", "mistake", "mixture", "monitor",
-            "morning", "musical", "mystery", "natural", "neither", "network", "neutral", "nuclear", "nursing",
-            "obvious",
-            "offense", "opening", "operate", "opinion", "optimal", "organic", "outline", "outlook", "overall",
-            "overlap",
-            "package", "parking", "partial", "partner", "passion", "patient", "pattern", "payment", "penalty",
-            "pending",
-            "perfect", "perform", "perhaps", "phantom", "picture", "plastic", "platform", "popular", "portion",
-            "poverty",
-            "precise", "predict", "premium", "prepare", "present", "prevent", "primary", "privacy", "private",
-            "problem",
-            "process", "produce", "product", "profile", "project", "promise", "promote", "protect", "provide",
-            "publish",
-            "purpose", "qualify", "quality", "quarter", "radical", "railway", "rainbow", "random", "readily", "reality",
-            "receipt", "receive", "recover", "reflect", "regular", "related", "release", "relevant", "remain",
-            "removal",
-            "replace", "request", "require", "rescue", "reserve", "respect", "respond", "restore", "revenue", "reverse",
-            "routine", "science", "scratch", "section", "segment", "serious", "service", "session", "setting",
-            "shelter",
-            "silence", "similar", "smoking", "society", "somehow", "speaker", "special", "station", "storage",
-            "strange",
-            "stretch", "student", "subject", "success", "suggest", "summary", "support", "suppose", "supreme",
-            "surface",
-            "survive", "suspect", "sustain", "symptom", "tactics", "teacher", "theater", "therapy", "through",
-            "tonight",
-            "traffic", "training", "transit", "trouble", "uniform", "unique", "unknown", "upgrade", "utility",
-            "variety",
-            "vehicle", "venture", "version", "village", "virtual", "visible", "vitamin", "welfare", "western",
-            "whisper",
-            "willing", "windows", "winning", "wireless", "witness", "working", "writing", "written", "achieve",
-            "blanket",
-            "brother", "cabinet", "channel", "command", "crystal", "diamond", "digital", "drawing", "element",
-            "evening",
-            "explore", "factory", "fishing", "freedom", "gallery", "genetic", "harvest", "heading", "install",
-            "journey",
-            "kitchen", "landing", "machine", "manager", "morning", "mystery", "network", "operate", "package",
-            "parking",
-            "perfect", "picture", "plastic", "popular", "present", "primary", "privacy", "problem", "protect",
-            "publish",
-            "railway", "reality", "regular", "replace", "request", "science", "section", "service", "setting",
-            "similar",
-            "society", "station", "strange", "student", "suggest", "support", "surface", "teacher", "theater",
-            "through",
-            "tonight", "traffic", "trouble", "uniform", "upgrade", "utility", "variety", "vehicle", "venture",
-            "version",
-            "village", "virtual", "visible", "welfare", "western", "willing", "windows", "winning", "witness",
-            "working",
-            "writing", "written", "abandon", "ability", "absence", "academy", "account", "accused", "acquire",
-            "address",
-            "advance", "advocate", "african", "against", "already", "ancient", "another", "anxiety", "anybody",
-            "attempt",
-            "attract", "auction", "average", "balance", "battery", "beneath", "benefit", "between", "bicycle",
-            "brought",
-            "builder", "burning", "calcium", "campaign", "capable", "capacity", "capital", "captain", "capture",
-            "careful",
-            "carrier", "catalog", "ceiling", "central", "century", "certain", "chamber", "chapter", "charity",
-            "chemical",
-            "chicken", "circuit", "citizen", "classic", "climate", "clothes", "college", "combine", "comfort",
-            "comment",
-            "company", "compare", "compile", "complex", "compute", "concept", "concern", "confirm", "connect",
-            "consent",
-            "consist", "contact", "contain", "content", "contest", "context", "control", "convert", "council",
-            "counter",
-            "country", "courage", "culture", "current", "custody", "dealing", "decline", "default", "defense",
-            "deliver",
-            "density", "deposit", "desktop", "despite", "destroy", "diagram", "dignity", "diploma", "disable",
-            "disease",
-            "dismiss", "display", "dispute", "divorce", "domestic", "dynamic", "eastern", "economy", "enhance",
-            "evening",
-            "exclude", "execute", "exhibit", "explain", "extreme", "failure", "fantasy", "fashion", "feature",
-            "federal",
-            "finance", "finding", "fitness", "foreign", "formula", "fortune", "forward", "freight", "funeral",
-            "gateway",
-            "general", "genuine", "glimpse", "grocery", "growing", "habitat", "harmony", "hearing", "heating",
-            "holiday",
-            "horizon", "husband", "illegal", "imagery", "imagine", "immune", "impact", "improve", "initial", "inquiry",
-            "insight", "instead", "intense", "interim", "involve", "journal", "justice", "justify", "largely",
-            "leading",
-            "learning", "leaving", "lecture", "leisure", "license", "limited", "listing", "logical", "loyalty",
-            "mandate",
-            "martial", "maximum", "meaning", "measure", "medical", "meeting", "mental", "message", "mineral", "minimal",
-            "minimum", "mission", "mistake", "mixture", "monitor", "musical", "natural", "neither", "neutral",
-            "nuclear",
-            "nursing", "obvious", "offense", "opening", "opinion", "optimal", "organic", "outline", "outlook",
-            "overall",
-            "overlap", "partial", "partner", "passion", "patient", "pattern", "payment", "penalty", "pending",
-            "perform",
-            "perhaps", "phantom", "portion", "poverty", "precise", "predict", "premium", "prepare", "prevent",
-            "privacy",
-            "private", "process", "produce", "product", "profile", "project", "promise", "promote", "provide",
-            "purpose",
-            "qualify", "quality", "quarter", "radical", "railway", "rainbow", "random", "readily", "receipt", "receive",
-            "recover", "reflect", "related", "release", "relevant", "remain", "removal", "require", "rescue", "reserve",
-            "respect", "respond", "restore", "revenue", "reverse", "routine", "scratch", "segment", "serious",
-            "session",
-            "shelter", "silence", "smoking", "somehow", "speaker", "special", "storage", "stretch", "subject",
-            "success",
-            "summary", "suppose", "supreme", "survive", "suspect", "sustain", "symptom", "tactics", "therapy",
-            "training",
-            "transit", "unique", "unknown", "village", "virtual", "visible", "vitamin", "welfare", "western", "whisper",
-            "willing", "windows", "winning", "wireless", "witness", "working", "writing", "written"
-        ]
-        return words
-
-    def load_common_passwords(self):
-        """Load common passwords for checking"""
-        # This is a sample list - you can expand this with more comprehensive lists
-        common = [
-            "123456", "password", "123456789", "12345678", "12345", "1234567", "1234567890",
-            "qwerty", "abc123", "password1", "111111", "123123", "admin", "letmein", "welcome",
-            "monkey", "1234", "dragon", "master", "login", "princess", "solo", "sunshine",
-            "passw0rd", "football", "baseball", "jordan", "freedom", "batman", "trustno1",
-            "password123", "welcome1", "hello", "charlie", "access", "shadow", "flower",
-            "123qwe", "iloveyou", "superman", "whatever", "killer", "summer", "michael",
-            "ranger", "lovely", "babygirl", "ashley", "nicole", "cheese", "computer",
-            "soccer", "internet", "service", "canada", "hello123", "guest", "buster",
-            "test", "love", "0000", "2000", "jordan23", "eagle1", "pass", "fuckme",
-            "badboy", "hunter", "test123", "cricket", "pass@word1", "changeme", "secret",
-            "orange", "fuckyou", "starwars", "password!", "Password", "Password1",
-            "Password123", "password@123", "p@ssw0rd", "P@ssw0rd", "P@ssword",
-            "password1!", "qwertyuiop", "asdfghjkl", "zxcvbnm", "qwerty123",
-            "123456a", "a123456", "password12", "admin123", "root", "toor",
-            "administrator", "default", "guest123", "user", "temp", "demo"
-        ]
-        return set(common)
+    def load_analysis(self):
+        """Build the word lists and pattern tables after the first paint"""
+        STARTUP.mark("first paint")
+        self.ensure_analysis()
+        STARTUP.mark("analysis loaded")
+        STARTUP.report()
+
+    def ensure_analysis(self):
+        """Build the analyzers now if they are needed before load_analysis ran"""
+        if self.analyzer is not None:
+            return
+        # Word lists, common passwords and scoring live in the shared analyzer
+        self.analyzer = PasswordAnalyzer()
+        self.word_list = self.analyzer.word_list
+        self.symbol_list = self.analyzer.symbol_list
+        # Per-keystroke checks update incrementally while the user types
+        self.live_analyzer = IncrementalAnalyzer(self.analyzer)
 
     def check_common_patterns(self, password):
         """Check for common password patterns and weaknesses"""
-        warnings = []
-
-        # Check against common passwords
-        if password.lower() in self.common_passwords:
-            warnings.append("WARNING: This is a commonly used password")
-
-        # Check for keyboard patterns
-        keyboard_patterns = [
-            "qwerty", "qwertyuiop", "asdfghjkl", "zxcvbnm", "12345",
-            "abcde", "1qaz", "2wsx", "3edc", "4rfv", "5tgb", "6yhn"
-        ]
-
-        for pattern in keyboard_patterns:
-            if pattern in password.lower():
-                warnings.append("WARNING: Contains keyboard pattern")
-                break
-
-        # Check for sequential numbers
-        if re.search(r'(012|123|234|345|456|567|678|789|890)', password):
-            warnings.append("WARNING: Contains sequential numbers")
-
-        # Check for repeated characters
-        if re.search(r'(.)\1{2,}', password):
-            warnings.append("WARNING: Contains repeated characters")
-
-        # Check for dictionary words
-        password_lower = password.lower()
-        for word in self.word_list:
-            if len(word) > 3 and word.lower() in password_lower:
-                warnings.append("WARNING: Contains dictionary word")
-                break
-
-        # Check for personal info patterns
-        personal_patterns = [
-            r'\b(19|20)\d{2}\b',  # Years
-            r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',  # Months
-            r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',  # Days
-            r'\b(password|login|admin|user|guest|test|demo)\b'  # Common words
-        ]
-
-        for pattern in personal_patterns:
-            if re.search(pattern, password.lower()):
-                warnings.append("WARNING: Contains predictable pattern")
-                break
-
-        # Check for insufficient length
-        if len(password) < 8:
-            warnings.append("WARNING: Password is too short (minimum 8 characters)")
-
-        # Check for missing character types
-        if not re.search(r'[A-Z]', password) and len(password) > 0:
-            warnings.append("TIP: Consider adding uppercase letters")
-        if not re.search(r'[a-z]', password) and len(password) > 0:
-            warnings.append("TIP: Consider adding lowercase letters")
-        if not re.search(r'\d', password) and len(password) > 0:
-            warnings.append("TIP: Consider adding numbers")
-        if not re.search(r'[^A-Za-z0-9]', password) and len(password) > 0:
-            warnings.append("TIP: Consider adding symbols")
-
-        return warnings
+        self.ensure_analysis()
+        return self.live_analyzer.check_common_patterns(password)
 
     def generate_passphrase(self):
         """Generate a secure passphrase using one of the Excel-style formulas randomly"""
-        # Randomly select one of your Excel formulas:
-
-        # Formula 1: word + num + symbol + WORD + symbol + word + num
-        # =INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99)&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1))&UPPER(INDEX(WordList!A:A,RANDBETWEEN(1,1500),1))&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99))
-
-        # Formula 2: word + symbol + WORD + num + symbol + word + num
-        # =INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&UPPER(INDEX(WordList!A:A,RANDBETWEEN(1,1500),1))&(RANDBETWEEN(10,99))&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99))
-
-        # Formula 3: word + num + symbol + WORD + num + symbol + word
-        # =INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)&(RANDBETWEEN(10,99)&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1))&UPPER(INDEX(WordList!A:A,RANDBETWEEN(1,1500),1))&(RANDBETWEEN(10,99))&INDEX(SymbolList!A:A,RANDBETWEEN(1,11),1)&INDEX(WordList!A:A,RANDBETWEEN(1,1500),1)
-
-        word1 = random.choice(self.word_list)
-        word2 = random.choice(self.word_list).upper()
-        word3 = random.choice(self.word_list)
-        num1 = random.randint(10, 99)
-        num2 = random.randint(10, 99)
-        symbol1 = random.choice(self.symbol_list)
-        symbol2 = random.choice(self.symbol_list)
-
-        # Randomly choose one of the formula patterns
-        formula_choice = random.randint(1, 3)
-
-        if formula_choice == 1:
-            # Formula 1: word + num + symbol + WORD + symbol + word + num
-            passphrase = f"{word1}{num1}{symbol1}{word2}{symbol2}{word3}{num2}"
-            pattern = "Pattern 1: word+num+symbol+WORD+symbol+word+num"
-
-        elif formula_choice == 2:
-            # Formula 2: word + symbol + WORD + num + symbol + word + num
-            passphrase = f"{word1}{symbol1}{word2}{num1}{symbol2}{word3}{num2}"
-            pattern = "Pattern 2: word+symbol+WORD+num+symbol+word+num"
-
-        else:
-            # Formula 3: word + num + symbol + WORD + num + symbol + word
-            passphrase = f"{word1}{num1}{symbol1}{word2}{num2}{symbol2}{word3}"
-            pattern = "Pattern 3: word+num+symbol+WORD+num+symbol+word"
+        import random  # Only needed once a suggestion is requested, not at startup
+        self.ensure_analysis()
+        passphrase = make_passphrase(random, self.word_list, self.symbol_list)
 
         self.current_suggestion = passphrase
 
@@ -547,72 +315,8 @@ class PasswordVisualizer:
 
     def get_password_strength(self, password):
         """Calculate password strength and character counts"""
-        if not password:
-            return {
-                'score': 0,
-                'capitals': 0,
-                'lowers': 0,
-                'numbers': 0,
-                'symbols': 0
-            }
-
-        # Count character types
-        capitals = len(re.findall(r'[A-Z]', password))
-        lowers = len(re.findall(r'[a-z]', password))
-        numbers = len(re.findall(r'\d', password))
-        symbols = len(re.findall(r'[^A-Za-z0-9]', password))
-        length = len(password)
-
-        # Basic scoring algorithm
-        score = 0
-
-        # Length points (up to 40 points)
-        score += min(length * 3, 40)
-
-        # Character type points
-        if capitals > 0:
-            score += min(capitals * 2, 10)
-        if lowers > 0:
-            score += min(lowers * 2, 10)
-        if numbers > 0:
-            score += min(numbers * 2, 10)
-        if symbols > 0:
-            score += min(symbols * 3, 15)
-
-        # Bonus for mixture of character types (up to 20 points)
-        types_used = 0
-        if capitals > 0:
-            types_used += 1
-        if lowers > 0:
-            types_used += 1
-        if numbers > 0:
-            types_used += 1
-        if symbols > 0:
-            types_used += 1
-        score += types_used * 5
-
-        # Penalty for common passwords and patterns
-        warnings = self.check_common_patterns(password)
-        penalty = 0
-        for warning in warnings:
-            if "commonly used" in warning:
-                penalty += 30
-            elif "keyboard pattern" in warning or "sequential" in warning:
-                penalty += 15
-            elif "repeated characters" in warning:
-                penalty += 10
-            elif "dictionary word" in warning:
-                penalty += 5
-
-        score = max(0, score - penalty)
-
-        return {
-            'score': min(score, 100),
-            'capitals': capitals,
-            'lowers': lowers,
-            'numbers': numbers,
-            'symbols': symbols
-        }
+        self.ensure_analysis()
+        return self.live_analyzer.get_password_strength(password)
 
     def update_display(self, *args):
         """Update the display when the password changes"""
@@ -642,48 +346,32 @@ class PasswordVisualizer:
             self.strength_label.config(fg="#00AA00")  # Green
 
         # Check for warnings
-        warnings = self.check_common_patterns(password)
-        if warnings:
-            warning_text = " | ".join(warnings[:3])  # Show first 3 warnings, separated by |
-            if len(warnings) > 3:
-                warning_text += f" | +{len(warnings) - 3} more issues"
-            self.warning_label.config(text=warning_text)
+        self.update_warnings(password)
+
+        # Update password display (only the visible part is colour-tagged)
+        self.display.show(password)
+
+    def update_warnings(self, password):
+        """Show the most important warnings, running only the checks needed"""
+        self.ensure_analysis()
+        if self.warnings_expanded:
+            warnings = self.live_analyzer.check_common_patterns(password)
+            warning_text = " | ".join(warnings)
+            if len(warnings) > self.max_warnings:
+                warning_text += " | (click to collapse)"
         else:
-            self.warning_label.config(text="")
-
-        # Update password display
-        if not password:
-            # Clear display if no password
-            self.password_text.config(state=tk.NORMAL)
-            self.password_text.delete(1.0, tk.END)
-            self.password_text.config(state=tk.DISABLED)
-            return
-
-        # Enable text widget for editing
-        self.password_text.config(state=tk.NORMAL)
-
-        # Clear current content
-        self.password_text.delete(1.0, tk.END)
-
-        # Add each character with appropriate color
-        for char in password:
-            if re.match(r'[A-Z]', char):
-                tag = "uppercase"
-            elif re.match(r'[a-z]', char):
-                tag = "lowercase"
-            elif re.match(r'\d', char):
-                tag = "digit"
-            else:
-                tag = "symbol"
-
-            self.password_text.insert(tk.END, char, tag)
-
-        # Center the text
-        self.password_text.tag_add("center", "1.0", "end")
-        self.password_text.tag_configure("center", justify='center')
-
-        # Disable text widget to prevent editing
-        self.password_text.config(state=tk.DISABLED)
+            # One extra warning tells us whether there is more to expand
+            warnings = list(itertools.islice(
+                self.live_analyzer.iter_warnings(password), self.max_warnings + 1))
+            warning_text = " | ".join(warnings[:self.max_warnings])  # Separated by |
+            if len(warnings) > self.max_warnings:
+                warning_text += " | more issues (click to expand)"
+        self.warning_label.config(text=warning_text)
+
+    def toggle_warnings(self, event=None):
+        """Expand or collapse the full warning list"""
+        self.warnings_expanded = not self.warnings_expanded
+        self.update_warnings(self.input_var.get())
 
     def on_ok(self):
         """Handle OK button click or Enter key"""
@@ -698,6 +386,7 @@ class PasswordVisualizer:
 def show_password_window():
     """Show the password visualizer window and return the result"""
     root = tk.Tk()
+    STARTUP.mark("tk")
     app = PasswordVisualizer(root)
     root.mainloop()
     return app.get_result()
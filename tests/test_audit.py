@@ -0,0 +1,54 @@
+from PasswordClarity_audit import DuplicateFinder, main
+
+CREDENTIALS = [
+    ("alice", "Summer2023!"),
+    ("bob", "summer#24"),
+    ("carol", "SUMMER99"),
+    ("dave", "Summer2023!"),
+    ("j\udce9r\udcf4me", "Summer1"),
+    ("erin", "correct-horse"),
+    ("frank", "123456"),
+    ("grace", "123456"),
+    ("heidi", "unrelated"),
+]
+
+
+def find_groups(max_records):
+    finder = DuplicateFinder(max_records=max_records)
+    for account, password in CREDENTIALS:
+        finder.add(account, password)
+    return list(finder.groups_found())
+
+
+def test_spilled_runs_match_in_memory_grouping():
+    in_memory = find_groups(max_records=1_000_000)
+    assert find_groups(max_records=1) == in_memory
+    assert find_groups(max_records=3) == in_memory
+
+    accounts = sorted(sorted(group['accounts']) for group in in_memory)
+    assert ["alice", "bob", "carol", "dave", "j\udce9r\udcf4me"] in accounts
+    assert ["frank", "grace"] in accounts
+
+
+def test_duplicates_command_keeps_non_utf8_accounts(tmp_path, capfdbinary):
+    export = tmp_path / "export.tsv"
+    export.write_bytes(b"j\xe9r\xf4me\tSummer1\nalice\tSummer2023!\n")
+    assert main(["duplicates", str(export), "--max-records", "1"]) == 0
+    out = capfdbinary.readouterr().out
+    assert b"j\xe9r\xf4me" in out
+
+
+def test_short_skeletons_only_group_exact_matches():
+    finder = DuplicateFinder()
+    for account, password in [("a", "a1"), ("b", "a123456"), ("c", "a!"),
+                              ("d", "x99!"), ("e", "x99!")]:
+        finder.add(account, password)
+    groups = list(finder.groups_found())
+    assert [(group['kind'], group['accounts']) for group in groups] == [("exact", ["d", "e"])]
+
+
+def test_near_groups_report_exact_reuse_inside():
+    groups = find_groups(max_records=1)
+    summer = next(group for group in groups if "alice" in group['accounts'])
+    assert summer['kind'] == "near"
+    assert [sorted(accounts) for accounts in summer['exact_reuse']] == [["alice", "dave"]]
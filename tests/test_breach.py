@@ -0,0 +1,111 @@
+import io
+
+import pytest
+
+import PasswordClarity_breach
+from PasswordClarity_breach import main, open_breach_mirror, sha1_hex, update_mirror
+from PasswordClarity_core import AsciiBytesAnalyzer, PasswordAnalyzer
+
+
+def build(tmp_path, *dumps, dump_format="auto"):
+    paths = []
+    for number, content in enumerate(dumps):
+        path = tmp_path / f"dump{number}.txt"
+        path.write_bytes(content)
+        paths.append(str(path))
+    root = str(tmp_path / "mirror")
+    update_mirror(root, paths, dump_format, log=io.StringIO())
+    return root, paths
+
+
+def test_build_and_lookup(tmp_path):
+    hashed = f"{sha1_hex('tr0ub4dor')}:42\n".encode("ascii")
+    root, _ = build(tmp_path, b"hunter2\nhunter2\nletmein\n", hashed)
+    mirror = open_breach_mirror(root)
+    assert mirror.count("hunter2") == 2
+    assert mirror.count(b"letmein") == 1
+    assert mirror.count("tr0ub4dor") == 42
+    assert mirror.count("not in there") == 0
+
+
+def test_refresh_skips_imported_dumps(tmp_path):
+    root, paths = build(tmp_path, b"hunter2\n")
+    assert update_mirror(root, paths, log=io.StringIO()) == 0
+    assert open_breach_mirror(root).count("hunter2") == 1
+
+
+def test_non_utf8_passwords_hash_their_original_bytes(tmp_path):
+    root, _ = build(tmp_path, b"lat\xe9n1\nhunter2\n", dump_format="plain")
+    mirror = open_breach_mirror(root)
+    assert mirror.count(b"lat\xe9n1".decode("utf-8", "surrogateescape")) == 1
+
+    analyzer = AsciiBytesAnalyzer(PasswordAnalyzer(breach_mirror=mirror))
+    for line in (b"lat\xe9n1", b"hunter2"):
+        _, warnings = analyzer.analyze_line(line)
+        assert any("breach corpus" in warning for warning in warnings)
+
+
+def interrupt_build(root, dump, monkeypatch):
+    """Start building root from dump and stop it after 40 buckets were merged"""
+    merge_bucket = PasswordClarity_breach.merge_bucket
+    merged = []
+
+    def interrupt_after_some_buckets(*args):
+        if len(merged) == 40:
+            raise KeyboardInterrupt
+        merge_bucket(*args)
+        merged.append(args[1])
+
+    monkeypatch.setattr(PasswordClarity_breach, "merge_bucket", interrupt_after_some_buckets)
+    with pytest.raises(KeyboardInterrupt):
+        update_mirror(root, [str(dump)], log=io.StringIO())
+    monkeypatch.undo()
+
+
+def test_interrupted_build_resumes_without_double_counting(tmp_path, monkeypatch):
+    passwords = [f"password{n}".encode("ascii") for n in range(2000)]
+    dump = tmp_path / "dump.txt"
+    dump.write_bytes(b"\n".join(passwords) + b"\n")
+    root = str(tmp_path / "mirror")
+    interrupt_build(root, dump, monkeypatch)
+
+    update_mirror(root, [str(dump)], log=io.StringIO())
+    mirror = open_breach_mirror(root)
+    assert all(mirror.count(password) == 1 for password in passwords)
+    assert update_mirror(root, [str(dump)], log=io.StringIO()) == 0
+
+
+def test_interrupted_bucket_swap_is_completed(tmp_path):
+    root, paths = build(tmp_path, b"hunter2\n")
+    bucket = sha1_hex("hunter2")[:2]
+    live = tmp_path / "mirror" / bucket
+    # State after "live -> .old" but before ".new -> live": the staged copy wins
+    live.rename(live.with_name(bucket + ".old"))
+    staged = live.with_name(bucket + ".new")
+    staged.mkdir()
+    (staged / f"{sha1_hex('hunter2')[:5]}.txt").write_text(f"{sha1_hex('hunter2')[5:]}:7\n")
+
+    extra = tmp_path / "extra.txt"
+    extra.write_bytes(b"letmein\n")
+    update_mirror(root, [str(extra)], log=io.StringIO())
+    mirror = open_breach_mirror(root)
+    assert mirror.count("hunter2") == 7
+    assert mirror.count("letmein") == 1
+    assert sorted(p.name for p in (tmp_path / "mirror").iterdir() if p.name.startswith(bucket)) == [bucket]
+
+
+def test_missing_dumps_are_reported(tmp_path, monkeypatch, capsys):
+    dump = tmp_path / "dump.txt"
+    dump.write_bytes(b"".join(b"password%d\n" % n for n in range(2000)))
+    root = str(tmp_path / "mirror")
+    with pytest.raises(ValueError, match="does not exist"):
+        update_mirror(root, [str(tmp_path / "missing.txt")], log=io.StringIO())
+
+    interrupt_build(root, dump, monkeypatch)
+    dump.unlink()
+    with pytest.raises(ValueError, match="removed during an interrupted import"):
+        update_mirror(root, [], log=io.StringIO())
+    with pytest.raises(SystemExit) as exit_info:
+        main(["build", root, str(tmp_path / "other.txt")])
+    assert exit_info.value.code == 2
+    assert "removed during an interrupted import" in capsys.readouterr().err
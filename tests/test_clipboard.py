@@ -0,0 +1,101 @@
+import tkinter as tk
+
+import pytest
+
+from PasswordClarity import (CLIPBOARD_MAX_CHARS, CLIPBOARD_POLL_MAX_MS, CLIPBOARD_POLL_MIN_MS,
+                             PasswordVisualizer)
+
+
+class FakeClipboardWindow:
+    """Holds clipboard text and queued timers instead of a Tk event loop"""
+
+    def __init__(self):
+        self.clipboard = None  # None: nothing on the clipboard
+        self.timers = {}
+        self.jobs = 0
+
+    def clipboard_get(self):
+        if self.clipboard is None:
+            raise tk.TclError("CLIPBOARD selection doesn't exist")
+        return self.clipboard
+
+    def after(self, ms, func):
+        self.jobs += 1
+        self.timers[self.jobs] = (ms, func)
+        return self.jobs
+
+    def after_cancel(self, job):
+        del self.timers[job]
+
+    def run_timer(self):
+        """Run the one pending timer and return its delay"""
+        (job, (ms, func)), = self.timers.items()
+        del self.timers[job]
+        func()
+        return ms
+
+
+class Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def app():
+    # Only the clipboard-watch state; no widgets are built
+    app = PasswordVisualizer.__new__(PasswordVisualizer)
+    app.master = FakeClipboardWindow()
+    app.input_var = Var("")
+    app.watch_var = Var(True)
+    app.watch_job = None
+    app.watch_interval = CLIPBOARD_POLL_MIN_MS
+    app.clipboard_seen = None
+    app.own_copy = None
+    return app
+
+
+def test_new_clipboard_text_replaces_the_input(app):
+    app.master.clipboard = "Summer2023!\n"
+    app.toggle_clipboard_watch()
+    assert app.input_var.get() == "Summer2023!"
+    app.input_var.set("edited")
+    app.master.run_timer()
+    assert app.input_var.get() == "edited"  # Same clipboard: the user's edit is kept
+
+
+def test_polling_backs_off_and_resets_on_change(app):
+    app.master.clipboard = "first"
+    app.toggle_clipboard_watch()
+    delays = [app.master.run_timer() for _ in range(7)]
+    assert delays[0] == CLIPBOARD_POLL_MIN_MS
+    assert delays == sorted(delays) and delays[-1] == CLIPBOARD_POLL_MAX_MS
+    app.master.clipboard = "second"
+    app.master.run_timer()
+    assert app.input_var.get() == "second"
+    assert app.master.run_timer() == CLIPBOARD_POLL_MIN_MS
+
+
+def test_own_copies_and_large_text_are_skipped(app):
+    app.master.clipboard = "mine"
+    app.own_copy = app.clipboard_digest("mine")  # As left by copy_password
+    app.toggle_clipboard_watch()
+    assert app.input_var.get() == ""
+
+    app.master.clipboard = "x" * (CLIPBOARD_MAX_CHARS + 1)
+    app.master.run_timer()
+    assert app.input_var.get() == ""
+
+
+def test_turning_the_watch_off_cancels_polling(app):
+    app.master.clipboard = None
+    app.toggle_clipboard_watch()
+    assert len(app.master.timers) == 1
+    app.watch_var.set(False)
+    app.toggle_clipboard_watch()
+    assert not app.master.timers and app.watch_job is None
@@ -0,0 +1,119 @@
+import random
+import string
+
+import pytest
+
+from PasswordClarity_core import (AsciiBytesAnalyzer, IncrementalAnalyzer, PasswordAnalyzer,
+                                  classify_char, count_char_classes, password_skeleton)
+
+ALPHABET = string.ascii_letters + string.digits + " _-!@#\n" + "ÉßаО１İΣσ"
+FRAGMENTS = ["1990", "2020 ", "jan", "monday", "password", "admin ", "test", "qwerty", "12345",
+             "aaa", "123", "computer", "abcde", "welcome", "Password1", " 1999!", "19999",
+             "xadmin", "admin_"]
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return PasswordAnalyzer()
+
+
+@pytest.mark.parametrize("char, tag, lookalike", [
+    ("\u00c9", "uppercase", None),  # É
+    ("\u00df", "lowercase", None),  # ß
+    ("\uff11", "digit", "1"),  # Full-width 1
+    ("\u0430", "lowercase", "a"),  # Cyrillic a
+    ("\u200b", "symbol", ""),  # Zero-width space
+    ("A", "uppercase", None),
+    ("l", "lowercase", None),
+    ("0", "digit", None),
+    ("#", "symbol", None),
+])
+def test_classify_char(char, tag, lookalike):
+    assert classify_char(char) == (tag, lookalike)
+
+
+def test_ascii_has_no_lookalikes():
+    # Ambiguous ASCII (Il1, O0o) is reported separately, never as a lookalike
+    assert all(classify_char(chr(code))[1] is None for code in range(128))
+
+
+def test_count_char_classes():
+    assert count_char_classes("P@ss w0rd") == (1, 5, 1, 2)
+    assert count_char_classes("\u00c9\u00df\uff11\u0430\u200bA1#") == (2, 2, 2, 2)
+    assert count_char_classes("") == (0, 0, 0, 0)
+
+
+def results(analyzer, password):
+    return analyzer.get_password_strength(password), analyzer.check_common_patterns(password)
+
+
+def edits(rng, steps):
+    """Passwords reached by a random mix of typing, pasting, deleting and editing"""
+    password = ""
+    for _ in range(steps):
+        r = rng.random()
+        if r < 0.3:
+            password += rng.choice(FRAGMENTS)
+        elif r < 0.45:
+            password = password[:-rng.randint(1, 3)]
+        elif r < 0.55 and password:
+            i = rng.randrange(len(password))
+            password = password[:i] + rng.choice(ALPHABET) + password[i + 1:]
+        else:
+            password += rng.choice(ALPHABET)
+        yield password
+
+
+def test_bytes_path_matches_str_path(analyzer):
+    ascii_analyzer = AsciiBytesAnalyzer(analyzer)
+    rng = random.Random(5)
+    for _ in range(300):
+        for password in edits(rng, 8):
+            line = password.encode("utf-8")
+            assert ascii_analyzer.analyze_line(line) == results(analyzer, password), password
+
+
+def test_incremental_matches_full_analysis(analyzer):
+    incremental = IncrementalAnalyzer(analyzer)
+    rng = random.Random(7)
+    for _ in range(300):
+        # Each edit sequence continues from the previous one, as in the GUI
+        for password in edits(rng, 12):
+            assert results(incremental, password) == results(analyzer, password), password
+
+
+def test_checkpoint_rewinds_match_full_analysis(analyzer):
+    incremental = IncrementalAnalyzer(analyzer)
+    incremental.CHECKPOINT_INTERVAL = 4  # Exercise many checkpoints with short passwords
+    incremental.reset()
+    rng = random.Random(13)
+    for _ in range(300):
+        for password in edits(rng, 12):
+            assert results(incremental, password) == results(analyzer, password), password
+        assert len(incremental.checkpoints) == len(incremental.password) // 4 + 1
+
+
+def test_incremental_typing_matches_full_analysis(analyzer):
+    incremental = IncrementalAnalyzer(analyzer)
+    rng = random.Random(11)
+    for _ in range(200):
+        password = "".join(rng.choice(FRAGMENTS) if rng.random() < 0.3 else rng.choice(ALPHABET)
+                           for _ in range(8))
+        incremental.reset()
+        for end in range(len(password) + 1):
+            prefix = password[:end]
+            assert results(incremental, prefix) == results(analyzer, prefix), prefix
+
+
+@pytest.mark.parametrize("password, skeleton", [
+    ("Summer2023!", "summer"),
+    ("summer#24", "summer"),
+    ("SUMMER99", "summer"),
+    ("P@ssw0rd", "password"),
+    ("p4$$w0rd1", "password"),
+    ("forward12#CAPTAIN$morning", "forwardcaptainmorning"),
+    ("forward!!captain77morning", "forwardcaptainmorning"),
+    ("2023!", ""),
+])
+def test_password_skeleton(password, skeleton):
+    assert password_skeleton(password) == skeleton
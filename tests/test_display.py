@@ -0,0 +1,131 @@
+from PasswordClarity_core import classify_char
+from PasswordClarity_display import VirtualizedDisplay, after_first_paint
+
+
+class FakeWindow:
+    """Records bindings and queued callbacks instead of running a Tk event loop"""
+
+    def __init__(self):
+        self.bindings = {}
+        self.idle = []
+        self.timers = []
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+        return "binding"
+
+    def unbind(self, sequence, funcid=None):
+        del self.bindings[sequence]
+
+    def after_idle(self, func):
+        self.idle.append(func)
+
+    def after(self, ms, func):
+        self.timers.append(func)
+
+
+def test_after_first_paint_waits_for_expose_and_redraw():
+    window = FakeWindow()
+    calls = []
+    after_first_paint(window, lambda: calls.append("loaded"))
+    assert not window.idle and not window.timers  # Nothing runs in the mapping idle pass
+
+    window.bindings["<Expose>"](None)
+    assert "<Expose>" not in window.bindings  # One-shot
+    window.idle.pop()()  # The idle pass that redraws the exposed widgets
+    assert calls == []
+    window.timers.pop()()
+    assert calls == ["loaded"]
+
+
+class FakeText:
+    """Single-line Text stand-in that shows `width` characters at a time"""
+
+    def __init__(self, width=20):
+        self.width = width
+        self.content = ""
+        self.first = 0.0
+        self.tags = []
+
+    def configure(self, **options):
+        pass
+
+    config = configure
+
+    def delete(self, *indexes):
+        self.content = ""
+        self.tags = []
+
+    def insert(self, index, content):
+        self.content = content
+
+    def tag_add(self, tag, start, end):
+        self.tags.append((tag, self.column(start), self.column(end)))
+
+    def column(self, index):
+        # Like Tk, a "1.N" index past the end of line 1 is clamped to it
+        line, _, column = index.partition(".")
+        if line != "1" or not column.isdigit():
+            return len(self.content)
+        return min(int(column), len(self.content.split("\n")[0]))
+
+    def tag_remove(self, tag, *indexes):
+        self.tags = [t for t in self.tags if t[0] != tag]
+
+    def tag_configure(self, *args, **options):
+        pass
+
+    def xview(self):
+        length = max(1, len(self.content))
+        if length <= self.width:
+            return 0.0, 1.0
+        return self.first, min(1.0, self.first + self.width / length)
+
+    def xview_moveto(self, fraction):
+        length = max(1, len(self.content))
+        self.first = max(0.0, min(fraction, 1 - self.width / length))
+
+
+class FakeScrollbar:
+    def configure(self, **options):
+        pass
+
+    def set(self, first, last):
+        pass
+
+
+def visible_text(display):
+    first, last = display.visible_range()
+    return display.password[display.offset + first:display.offset + last]
+
+
+def test_typing_past_the_width_follows_the_end():
+    display = VirtualizedDisplay(FakeText(), FakeScrollbar(), chunk_size=64)
+    password = ""
+    for char in "abcdefghijklmnopqrstuvwxyz0123456789" * 3:
+        password += char
+        display.show(password)
+        assert visible_text(display).endswith(password[-1])
+
+
+def test_editing_keeps_the_view_position():
+    display = VirtualizedDisplay(FakeText(), FakeScrollbar(), chunk_size=64)
+    password = "".join(chr(ord("a") + n % 26) for n in range(200))
+    display.show(password)
+    display.scroll_to(100)
+    before = display.offset + display.visible_range()[0]
+    display.show(password[:150] + password[151:])  # Delete a character after the view
+    assert display.offset + display.visible_range()[0] == before
+
+
+def test_multi_line_secrets_are_tagged_past_the_line_break():
+    display = VirtualizedDisplay(FakeText(width=80), FakeScrollbar(), chunk_size=64)
+    password = "-----BEGIN KEY-----\nMIIBаl1\r\n-----END KEY-----"
+    display.show(password)
+    assert "\n" not in display.text.content
+    assert len(display.text.content) == len(password)
+    for position, char in enumerate(password):
+        tag, lookalike = classify_char(char)
+        tags = {t for t, start, end in display.text.tags if start <= position < end}
+        assert tag in tags, (position, char)
+        assert ("confusable" in tags) == (lookalike is not None), (position, char)
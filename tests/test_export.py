@@ -0,0 +1,62 @@
+import hashlib
+import io
+
+import pytest
+
+from PasswordClarity_audit import main
+from PasswordClarity_markov import train
+
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+
+SALT = bytes(range(32))
+PASSWORDS = [b"Summer2023!", b"caf\xc3\xa9-horse", b"lat\xe9n1"]
+
+
+@pytest.fixture
+def export_input(tmp_path):
+    path = tmp_path / "export.tsv"
+    path.write_bytes(b"".join(b"user%d\t%s\n" % (i, p) for i, p in enumerate(PASSWORDS)))
+    salt = tmp_path / "salt"
+    salt.write_bytes(SALT)
+    return path, salt
+
+
+def read_table(path, file_format):
+    if file_format == "parquet":
+        return pa.parquet.read_table(path)
+    with pa.OSFile(str(path)) as f:
+        return pa.ipc.open_stream(f).read_all()
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_export_writes_hashed_rows(tmp_path, export_input, file_format):
+    source, salt = export_input
+    model = tmp_path / "model.bin"
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_bytes(b"summer1\npassword\n" * 50)
+    train(str(model), [str(corpus)], samples=200, seed=1, log=io.StringIO())
+
+    output = tmp_path / f"out.{file_format}"
+    assert main(["export", str(source), str(output), "--format", file_format,
+                 "--separator", "\t", "--salt-file", str(salt), "--model", str(model),
+                 "--row-group-size", "2"]) == 0
+
+    table = read_table(output, file_format)
+    assert table.column("account").to_pylist() == ["user0", "user1", "user2"]
+    assert table.column("password_hash").to_pylist() == [
+        hashlib.blake2b(p, digest_size=32, key=SALT).digest() for p in PASSWORDS]
+    assert table.column("length").to_pylist() == [11, 10, 6]  # Characters, not bytes
+    counts = zip(*(table.column(name).to_pylist()
+                   for name in ("capitals", "lowers", "numbers", "symbols")))
+    assert [sum(row) for row in counts] == table.column("length").to_pylist()
+    assert all(g >= 1 for g in table.column("guesses").to_pylist())
+    assert b"password_clarity.warning_flags" in table.schema.metadata
+
+
+@pytest.mark.parametrize("salt", [b"", b"too short"])
+def test_export_rejects_short_salts(tmp_path, export_input, salt):
+    source, salt_file = export_input
+    salt_file.write_bytes(salt)
+    with pytest.raises(SystemExit, match="at least 16"):
+        main(["export", str(source), str(tmp_path / "out.parquet"), "--salt-file", str(salt_file)])
@@ -0,0 +1,69 @@
+import socket
+import threading
+
+import pytest
+
+from PasswordClarity_loadtest import LatencyHistogram, SocketTarget, memory_growth_mb, run_load
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.add(ms / 1000)
+    assert histogram.total() == 1000
+    assert histogram.percentile(0.50) == pytest.approx(0.5, rel=0.025)
+    assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.025)
+    assert histogram.percentile(1.0) == histogram.max == 1.0
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+def test_socket_target_reconnects_after_a_dead_connection():
+    listener = socket.create_server(("127.0.0.1", 0))
+    served = []
+
+    def serve():
+        # Drop the first connection unanswered, answer on the second
+        for reply in (None, b'{"rss": 1}\n'):
+            conn, _ = listener.accept()
+            with conn:
+                conn.makefile("rb").readline()
+                if reply:
+                    conn.sendall(reply)
+                served.append(reply)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    target = SocketTarget(*listener.getsockname())
+    try:
+        with pytest.raises(OSError):
+            target.memory()
+        assert target.memory() == 1
+    finally:
+        target.close()
+        listener.close()
+    thread.join(5)
+    assert served == [None, b'{"rss": 1}\n']
+
+
+class FlakyTarget:
+    """Answers every call but fails every other memory sample"""
+
+    def __init__(self):
+        self.samples = 0
+
+    def call(self, password):
+        pass
+
+    def memory(self):
+        self.samples += 1
+        if self.samples % 2:
+            raise ConnectionError("stats request failed")
+        return self.samples * 1024 * 1024
+
+
+def test_failed_memory_samples_do_not_abort_the_run():
+    results = run_load(FlakyTarget(), ["pw"], concurrency=2, duration=0.3, sample_interval=0.05)
+    assert results['requests'] > 0
+    assert results['memory'][0][1] is None
+    assert any(rss is not None for _, rss in results['memory'])
+    assert memory_growth_mb(results) is not None
@@ -0,0 +1,65 @@
+import io
+import random
+
+import pytest
+
+from PasswordClarity_core import IncrementalAnalyzer, PasswordAnalyzer
+from PasswordClarity_markov import MarkovModel, password_symbols, train
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    rng = random.Random(3)
+    words = ["summer", "dragon", "monkey", "shadow", "master", "soccer"]
+    lines = [b"lat\xe9n1"]
+    for _ in range(5000):
+        lines.append((rng.choice(words) + str(rng.randint(0, 99))).encode("ascii"))
+        lines.append(b"password")
+    corpus = tmp_path_factory.mktemp("corpus") / "corpus.txt"
+    corpus.write_bytes(b"\n".join(lines) + b"\n")
+    path = str(corpus.with_name("model.bin"))
+    train(path, [str(corpus)], samples=2000, seed=1, log=io.StringIO())
+    return path
+
+
+def test_guess_numbers_follow_the_corpus(model_path):
+    model = MarkovModel(model_path)
+    assert model.guesses("password") < model.guesses("dragon42") < model.guesses("q8#Vz!p2Lw@r")
+    assert model.guesses("password") >= 1
+    assert model.guesses("password") == model.guesses(b"password")
+
+
+def test_with_counts_matches_repeated_lines(tmp_path):
+    plain = tmp_path / "plain.txt"
+    plain.write_bytes(b"abc\n" * 3 + b"xyz\n")
+    counted = tmp_path / "counted.txt"
+    counted.write_bytes(b"      3 abc\n      1 xyz\n")
+    train(str(tmp_path / "a.bin"), [str(plain)], samples=100, seed=1, log=io.StringIO())
+    train(str(tmp_path / "b.bin"), [str(counted)], with_counts=True, samples=100, seed=1,
+          log=io.StringIO())
+    assert (tmp_path / "a.bin").read_bytes() == (tmp_path / "b.bin").read_bytes()
+
+
+def test_surrogateescape_strs_score_as_their_bytes(model_path):
+    model = MarkovModel(model_path)
+    raw = b"lat\xe9n1"
+    assert password_symbols(raw.decode("utf-8", "surrogateescape")) == password_symbols(raw)
+    assert model.cost(raw.decode("utf-8", "surrogateescape")) == model.cost(raw)
+
+
+def test_incremental_model_cost_matches_whole_password(model_path):
+    model = MarkovModel(model_path)
+    analyzer = PasswordAnalyzer(strength_model=model)
+    incremental = IncrementalAnalyzer(analyzer)
+    password = ""
+    for char in "Dragon42!\udce9x":
+        password += char
+        assert incremental.guess_number(password) == analyzer.guess_number(password)
+        assert incremental.get_password_strength(password) == analyzer.get_password_strength(password)
+
+
+def test_strength_result_carries_the_guess_number(model_path):
+    analyzer = PasswordAnalyzer(strength_model=MarkovModel(model_path))
+    strength = analyzer.get_password_strength("dragon42")
+    assert strength['guesses'] == analyzer.guess_number("dragon42")
+    assert 'guesses' not in PasswordAnalyzer().get_password_strength("dragon42")
@@ -0,0 +1,55 @@
+import io
+
+from PasswordClarity_audit import (describe_token, html_token, main, render_ansi, spell_char,
+                                   write_svg_report)
+from PasswordClarity_core import COLORS
+
+
+def test_ambiguous_ascii_positions_and_reasons():
+    report = describe_token("Il1O0o")
+    assert report['ambiguous'] == [
+        (1, "I", "one of Il1|"), (2, "l", "one of Il1|"), (3, "1", "one of Il1|"),
+        (4, "O", "one of O0o"), (5, "0", "one of O0o"), (6, "o", "one of O0o"),
+    ]
+    assert report['spelled'] == ["CAPITAL INDIA", "lower lima", "digit one",
+                                 "CAPITAL OSCAR", "digit zero", "lower oscar"]
+
+
+def test_lookalikes_and_invisible_characters():
+    report = describe_token("p\u0430ss\u200bx")
+    assert report['ambiguous'] == [(2, "\u0430", "lookalike of 'a'"),
+                                   (5, "\u200b", "invisible")]
+    assert spell_char("\u0430") == "cyrillic small letter a (looks like lower alfa)"
+    assert spell_char("\u200b") == "zero width space (invisible)"
+    assert spell_char("#") == "hash"
+
+
+def test_undecodable_bytes_are_spelled_as_bytes(tmp_path, capfdbinary):
+    assert spell_char("\udcff") == "byte 0xFF"
+    path = tmp_path / "tokens.txt"
+    path.write_bytes(b"ab\xffcd\n")
+    assert main(["report", str(path)]) == 0
+    out = capfdbinary.readouterr().out
+    assert b"ab\xffcd" in out
+    assert b"byte 0xFF" in out and b"not valid UTF-8" in out
+
+
+def test_render_ansi_marks_lookalikes_and_ambiguous_characters():
+    assert render_ansi("#") == "#"  # Symbols keep the terminal's colour
+    background = COLORS['confusable']
+    red, green, blue = (int(background[i:i + 2], 16) for i in (1, 3, 5))
+    assert f"\x1b[48;2;{red};{green};{blue}m\u0430" in render_ansi("\u0430")
+    assert "\x1b[4m" in render_ansi("l")
+
+
+def test_html_and_svg_escape_markup():
+    assert "&lt;" in html_token("<&") and "&amp;" in html_token("<&")
+    assert "<&" not in html_token("<&")
+    assert "�" in html_token("\udcff")
+
+    out = io.StringIO()
+    write_svg_report([describe_token("a<b&\u0430")], out)
+    svg = out.getvalue()
+    assert svg.startswith("<svg") and svg.rstrip().endswith("</svg>")
+    assert ">&lt;</text>" in svg and ">&amp;</text>" in svg
+    assert f'fill="{COLORS["confusable"]}"' in svg
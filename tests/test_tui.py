@@ -0,0 +1,61 @@
+import curses
+
+from PasswordClarity_tui import PASTE_END, PASTE_START, TerminalVisualizer
+
+
+def visualizer():
+    # Key handling needs no screen; skip __init__, which sets up curses
+    tui = TerminalVisualizer.__new__(TerminalVisualizer)
+    tui.password = ""
+    tui.result = None
+    tui.rows = {}
+    tui.escape = ""
+    tui.pasting = False
+    tui.previous_key = None
+    return tui
+
+
+def test_enter_alone_submits():
+    tui = visualizer()
+    assert tui.handle_batch(list("secret"))
+    assert not tui.handle_batch(["\n"])
+    assert tui.result == "secret"
+
+
+def test_typed_ahead_enter_submits():
+    # Fast typing or a stalled redraw over SSH delivers Enter in the same batch
+    tui = visualizer()
+    assert not tui.handle_batch(list("hunter2") + ["\n"])
+    assert tui.result == "hunter2"
+
+
+def test_pasted_line_breaks_are_kept():
+    tui = visualizer()
+    pem = "-----BEGIN KEY-----\r\nMIIB\r\n-----END KEY-----\n"
+    assert tui.handle_batch(list(PASTE_START + pem + PASTE_END))
+    assert tui.password == "-----BEGIN KEY-----\nMIIB\n-----END KEY-----\n"
+    assert tui.result is None
+    assert not tui.handle_batch([curses.KEY_ENTER])
+    assert tui.result == tui.password
+
+
+def test_paste_split_across_batches():
+    tui = visualizer()
+    keys = list(PASTE_START + "ab\ncd" + PASTE_END) + ["\r"]
+    assert tui.handle_batch(keys[:3])
+    assert tui.handle_batch(keys[3:9])
+    assert not tui.handle_batch(keys[9:])
+    assert tui.result == "ab\ncd"
+
+
+def test_escape_cancels_but_other_sequences_are_ignored():
+    tui = visualizer()
+    assert tui.handle_batch(["a", "\x1b", "x", "b"])  # Alt+x
+    assert tui.password == "ab"
+    assert not tui.handle_batch(["\x1b"])
+    assert tui.result is None
+
+
+def test_line_breaks_are_drawn_as_a_symbol():
+    tui = visualizer()
+    assert tui.tail("ab\ncd", 10) == (0, "ab↵cd")